@@ -1,25 +1,130 @@
 #!/usr/bin/env python
 
 import os
+import functools
 import logging
-from typing import Optional, Dict, Any
+import shutil
+from datetime import datetime
+from operator import attrgetter
+from typing import Optional, Dict, Any, Set
 from dataclasses import dataclass, field
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Environment variable values treated as "true" for boolean flags
+_TRUTHY_VALUES = frozenset({"true", "1", "yes"})
+
+
+def _truthy(value: str) -> bool:
+    """Interpret an environment variable value as a boolean flag."""
+    return value.lower() in _TRUTHY_VALUES
+
+
+@functools.cache
+def _read_dotenv() -> Dict[str, str]:
+    """Parse the .env file once; later calls return the cached values."""
+    return {
+        key: value
+        for key, value in dotenv_values(find_dotenv()).items()
+        if value is not None
+    }
+
+
+def _apply_dotenv() -> None:
+    """Export cached .env values without overriding variables already set."""
+    for key, value in _read_dotenv().items():
+        os.environ.setdefault(key, value)
+
+
+# Environment variable overrides: (env name, config section, field, type cast)
+_ENV_SCHEMA = (
+    # Hacker News API
+    ("HN_MAX_STORIES", "hackernews", "max_stories", int),
+    ("HN_TIMEOUT", "hackernews", "timeout", int),
+    ("HN_MAX_CONCURRENT_REQUESTS", "hackernews", "max_concurrent_requests", int),
+    # Scraping
+    ("SCRAPING_USER_AGENT", "scraping", "user_agent", str),
+    ("SCRAPING_TIMEOUT", "scraping", "timeout", int),
+    ("SCRAPING_MAX_CONCURRENT_REQUESTS", "scraping", "max_concurrent_requests", int),
+    ("SCRAPING_CACHE_TTL_HOURS", "scraping", "cache_ttl_hours", int),
+    ("SCRAPING_REQUESTS_PER_HOST_PER_SECOND", "scraping", "requests_per_host_per_second", float),
+    # TTS
+    ("TTS_LANGUAGE_CODE", "tts", "language_code", str),
+    ("TTS_VOICE_NAME", "tts", "voice_name", str),
+    ("TTS_SPEAKING_RATE", "tts", "speaking_rate", float),
+    ("TTS_PITCH", "tts", "pitch", float),
+    ("TTS_MAX_CONCURRENT_REQUESTS", "tts", "max_concurrent_requests", int),
+    ("TTS_CACHE_TTL_HOURS", "tts", "cache_ttl_hours", int),
+    # Logging
+    ("LOG_LEVEL", "logging", "level", str.upper),
+    ("LOG_FILE", "logging", "log_file", str),
+    # Output
+    ("OUTPUT_BASE_DIR", "output", "base_dir", str),
+    # Podcast Publishing
+    ("TRANSISTOR_API_KEY", "podcast_publishing", "api_key", str),
+    ("TRANSISTOR_SHOW_ID", "podcast_publishing", "default_show_id", str),
+    ("TRANSISTOR_BASE_URL", "podcast_publishing", "base_url", str),
+    ("PODCAST_DEFAULT_SEASON", "podcast_publishing", "default_season", int),
+)
+
+# _ENV_SCHEMA with section names pre-resolved to attrgetters for the load loop
+_ENV_OVERRIDES = tuple(
+    (env_name, attrgetter(section), field_name, cast)
+    for env_name, section, field_name, cast in _ENV_SCHEMA
+)
+
+# Accepted logging levels
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# Validation rules: (AppConfig attribute getter, predicate, error message)
+_VALIDATORS = (
+    # Hacker News API
+    (attrgetter("hackernews.max_stories"), lambda v: v > 0,
+     "HN max_stories must be positive"),
+    (attrgetter("hackernews.timeout"), lambda v: v > 0,
+     "HN timeout must be positive"),
+    (attrgetter("hackernews.max_concurrent_requests"), lambda v: v > 0,
+     "HN max_concurrent_requests must be positive"),
+    # Scraping
+    (attrgetter("scraping.timeout"), lambda v: v > 0,
+     "Scraping timeout must be positive"),
+    (attrgetter("scraping.max_content_length"), lambda v: v > 0,
+     "Max content length must be positive"),
+    (attrgetter("scraping.max_concurrent_requests"), lambda v: v > 0,
+     "Scraping max_concurrent_requests must be positive"),
+    (attrgetter("scraping.cache_ttl_hours"), lambda v: v >= 0,
+     "Scraping cache_ttl_hours must not be negative"),
+    (attrgetter("scraping.requests_per_host_per_second"), lambda v: v >= 0,
+     "Scraping requests_per_host_per_second must not be negative"),
+    # TTS
+    (attrgetter("tts.speaking_rate"), lambda v: 0.25 <= v <= 4.0,
+     "TTS speaking rate must be between 0.25 and 4.0"),
+    (attrgetter("tts.pitch"), lambda v: -20.0 <= v <= 20.0,
+     "TTS pitch must be between -20.0 and 20.0"),
+    (attrgetter("tts.max_concurrent_requests"), lambda v: v > 0,
+     "TTS max_concurrent_requests must be positive"),
+    (attrgetter("tts.cache_ttl_hours"), lambda v: v >= 0,
+     "TTS cache_ttl_hours must not be negative"),
+    # Logging
+    (attrgetter("logging.level"), lambda v: v in _VALID_LOG_LEVELS,
+     f"Log level must be one of: {sorted(_VALID_LOG_LEVELS)}"),
+)
+
 
 @dataclass
 class HackerNewsConfig:
     """Configuration for Hacker News API."""
 
     base_url: str = "https://hacker-news.firebaseio.com/v0"
+    algolia_url: str = "https://hn.algolia.com/api/v1"
     max_stories: int = 20
     timeout: int = 30
     retry_attempts: int = 3
     retry_delay: float = 1.0
+    max_concurrent_requests: int = 10
 
 
 @dataclass
@@ -34,6 +139,9 @@ class ScrapingConfig:
     allowed_content_types: list = field(
         default_factory=lambda: ["text/html", "application/xhtml+xml"]
     )
+    max_concurrent_requests: int = 8
+    cache_ttl_hours: int = 24  # 0 disables the scraped article cache
+    requests_per_host_per_second: float = 5.0  # 0 disables per-host throttling
 
 
 @dataclass
@@ -46,6 +154,8 @@ class TTSConfig:
     pitch: float = 0.0
     max_text_length: int = 5000
     audio_format: str = "MP3"
+    max_concurrent_requests: int = 8
+    cache_ttl_hours: int = 72  # 0 disables the synthesized audio cache
 
 
 @dataclass
@@ -80,6 +190,7 @@ class OutputConfig:
     audio_dir: str = "audio"
     data_dir: str = "data"
     logs_dir: str = "logs"
+    cache_dir: str = "cache"
     date_format: str = "%Y-%m-%d"
 
 
@@ -90,6 +201,7 @@ class AppConfig:
     # Environment
     environment: str = "development"
     debug: bool = False
+    quiet: bool = False  # Suppress progress bars, e.g. for cron runs
 
     # Component configurations
     hackernews: HackerNewsConfig = field(default_factory=HackerNewsConfig)
@@ -114,81 +226,48 @@ class ConfigManager:
         Args:
             config_file: Optional path to configuration file
         """
-        # Load environment variables from .env file
-        load_dotenv()
+        # Load environment variables from .env file (parsed once per process)
+        _apply_dotenv()
 
         self._config = AppConfig()
+        # Directories this manager has already created, so repeat path
+        # lookups skip the mkdir syscalls
+        self._ensured_dirs: Set[Path] = set()
         self._load_from_environment()
 
         if config_file and os.path.exists(config_file):
             self._load_from_file(config_file)
 
         self._validate_config()
-        self._setup_directories()
 
     def _load_from_environment(self) -> None:
         """Load configuration from environment variables."""
-        # Environment
-        self._config.environment = os.getenv("HACKERCAST_ENV", self._config.environment)
-        self._config.debug = os.getenv("HACKERCAST_DEBUG", "").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
-
-        # Hacker News API
-        if os.getenv("HN_MAX_STORIES"):
-            self._config.hackernews.max_stories = int(os.getenv("HN_MAX_STORIES"))
-        if os.getenv("HN_TIMEOUT"):
-            self._config.hackernews.timeout = int(os.getenv("HN_TIMEOUT"))
-
-        # Scraping
-        if os.getenv("SCRAPING_USER_AGENT"):
-            self._config.scraping.user_agent = os.getenv("SCRAPING_USER_AGENT")
-        if os.getenv("SCRAPING_TIMEOUT"):
-            self._config.scraping.timeout = int(os.getenv("SCRAPING_TIMEOUT"))
-
-        # TTS
-        if os.getenv("TTS_LANGUAGE_CODE"):
-            self._config.tts.language_code = os.getenv("TTS_LANGUAGE_CODE")
-        if os.getenv("TTS_VOICE_NAME"):
-            self._config.tts.voice_name = os.getenv("TTS_VOICE_NAME")
-        if os.getenv("TTS_SPEAKING_RATE"):
-            self._config.tts.speaking_rate = float(os.getenv("TTS_SPEAKING_RATE"))
-        if os.getenv("TTS_PITCH"):
-            self._config.tts.pitch = float(os.getenv("TTS_PITCH"))
+        # Snapshot the environment once so each variable is looked up a single time
+        env = os.environ.copy()
+        config = self._config
 
-        # Google Cloud
-        self._config.google_credentials_path = os.getenv(
-            "GOOGLE_APPLICATION_CREDENTIALS"
-        )
-        self._config.google_project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
+        # Optional overrides: only applied when the variable is set and non-empty
+        for env_name, get_section, field_name, cast in _ENV_OVERRIDES:
+            value = env.get(env_name)
+            if value:
+                setattr(get_section(config), field_name, cast(value))
 
-        # Logging
-        if os.getenv("LOG_LEVEL"):
-            self._config.logging.level = os.getenv("LOG_LEVEL").upper()
-        if os.getenv("LOG_FILE"):
-            self._config.logging.log_file = os.getenv("LOG_FILE")
+        # Environment
+        config.environment = env.get("HACKERCAST_ENV", config.environment)
+        config.debug = _truthy(env.get("HACKERCAST_DEBUG", ""))
+        config.quiet = _truthy(env.get("HACKERCAST_QUIET", ""))
 
-        # Output
-        if os.getenv("OUTPUT_BASE_DIR"):
-            self._config.output.base_dir = os.getenv("OUTPUT_BASE_DIR")
+        # Google Cloud
+        config.google_credentials_path = env.get("GOOGLE_APPLICATION_CREDENTIALS")
+        config.google_project_id = env.get("GOOGLE_CLOUD_PROJECT")
 
         # Podcast Publishing
-        self._config.podcast_publishing.enabled = os.getenv("PODCAST_PUBLISHING_ENABLED", "").lower() in (
-            "true", "1", "yes"
+        config.podcast_publishing.enabled = _truthy(
+            env.get("PODCAST_PUBLISHING_ENABLED", "")
         )
-        if os.getenv("TRANSISTOR_API_KEY"):
-            self._config.podcast_publishing.api_key = os.getenv("TRANSISTOR_API_KEY")
-        if os.getenv("TRANSISTOR_SHOW_ID"):
-            self._config.podcast_publishing.default_show_id = os.getenv("TRANSISTOR_SHOW_ID")
-        if os.getenv("TRANSISTOR_BASE_URL"):
-            self._config.podcast_publishing.base_url = os.getenv("TRANSISTOR_BASE_URL")
-        self._config.podcast_publishing.auto_publish = os.getenv("PODCAST_AUTO_PUBLISH", "true").lower() in (
-            "true", "1", "yes"
+        config.podcast_publishing.auto_publish = _truthy(
+            env.get("PODCAST_AUTO_PUBLISH", "true")
         )
-        if os.getenv("PODCAST_DEFAULT_SEASON"):
-            self._config.podcast_publishing.default_season = int(os.getenv("PODCAST_DEFAULT_SEASON"))
 
     def _load_from_file(self, config_file: str) -> None:
         """Load configuration from file (JSON/YAML)."""
@@ -198,36 +277,23 @@ class ConfigManager:
 
     def _validate_config(self) -> None:
         """Validate configuration values."""
-        errors = []
-
-        # Validate HN config
-        if self._config.hackernews.max_stories <= 0:
-            errors.append("HN max_stories must be positive")
-        if self._config.hackernews.timeout <= 0:
-            errors.append("HN timeout must be positive")
-
-        # Validate scraping config
-        if self._config.scraping.timeout <= 0:
-            errors.append("Scraping timeout must be positive")
-        if self._config.scraping.max_content_length <= 0:
-            errors.append("Max content length must be positive")
-
-        # Validate TTS config
-        if not (0.25 <= self._config.tts.speaking_rate <= 4.0):
-            errors.append("TTS speaking rate must be between 0.25 and 4.0")
-        if not (-20.0 <= self._config.tts.pitch <= 20.0):
-            errors.append("TTS pitch must be between -20.0 and 20.0")
-
-        # Validate logging config
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self._config.logging.level not in valid_log_levels:
-            errors.append(f"Log level must be one of: {valid_log_levels}")
+        errors = [
+            message
+            for getter, is_valid, message in _VALIDATORS
+            if not is_valid(getter(self._config))
+        ]
 
         if errors:
             raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
 
-    def _setup_directories(self) -> None:
-        """Create necessary output directories."""
+    def ensure_directories(self) -> None:
+        """
+        Create the output directories.
+
+        Called lazily by the path helpers so that read-only users of the
+        configuration never touch the filesystem. Each directory is created at
+        most once per manager.
+        """
         base_path = Path(self._config.output.base_dir)
         directories = [
             base_path,
@@ -237,8 +303,15 @@ class ConfigManager:
         ]
 
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {directory}")
+            self._ensure_directory(directory)
+
+    def _ensure_directory(self, directory: Path) -> None:
+        """Create a directory (and parents) unless this manager already did."""
+        if directory in self._ensured_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(directory)
+        logger.debug(f"Ensured directory exists: {directory}")
 
     @property
     def config(self) -> AppConfig:
@@ -256,6 +329,7 @@ class ConfigManager:
         Returns:
             Full path to the file
         """
+        self.ensure_directories()
         base_path = Path(self._config.output.base_dir)
 
         if file_type == "audio":
@@ -284,12 +358,11 @@ class ConfigManager:
         Returns:
             Path object for the latest file
         """
-        from datetime import datetime
-        import shutil
-
         if date_str is None:
             date_str = datetime.now().strftime("%Y%m%d")
 
+        self.ensure_directories()
+
         # Get base directory for this file type
         base_path = Path(self._config.output.base_dir)
         if file_type == "audio":
@@ -301,9 +374,9 @@ class ConfigManager:
         else:
             raise ValueError(f"Unknown file type: {file_type}")
 
-        # Create date-based subdirectory
+        # Create date-based subdirectory (once per manager)
         date_dir = type_dir / date_str
-        date_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(date_dir)
 
         # Path for the latest file
         latest_file = date_dir / f"latest.{extension}"
@@ -3,24 +3,104 @@
 import json
 import logging
 import sys
-import time
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 from config import get_config
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fields every HN item must carry to be usable as a story
+_REQUIRED_STORY_FIELDS = frozenset(("id", "title", "score", "by", "time", "descendants"))
+
+# Process-wide HTTP sessions shared by HackerNewsAPI instances, keyed by the
+# settings that shape them (retry policy and pool size)
+_shared_sessions: Dict[Tuple[int, float, int], requests.Session] = {}
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session(hn_config) -> requests.Session:
+    """
+    Get the shared HN API session for a configuration, creating it on first use.
+
+    Every request goes to the same host, so a single keep-alive connection
+    pool avoids repeating DNS/TCP/TLS setup for each new client. Clients
+    configured with different retry or concurrency settings get their own
+    session, so raising max_concurrent_requests also widens the pool.
+
+    Args:
+        hn_config: HackerNewsConfig used to configure retries and pool size
+
+    Returns:
+        Shared requests.Session
+    """
+    key = (
+        hn_config.retry_attempts,
+        hn_config.retry_delay,
+        hn_config.max_concurrent_requests,
+    )
+    with _shared_session_lock:
+        session = _shared_sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            retry_strategy = Retry(
+                total=hn_config.retry_attempts,
+                backoff_factor=hn_config.retry_delay,
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
+            # Size the connection pool to match the story fetch concurrency
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_maxsize=hn_config.max_concurrent_requests,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _shared_sessions[key] = session
+        return session
+
 
-@dataclass
+def _truncate_json_array(body: bytes, max_items: int) -> bytes:
+    """
+    Cut a flat JSON array of scalars down to its first max_items elements.
+
+    topstories.json returns ~500 IDs of which only the first few are used,
+    so the tail is dropped before decoding rather than parsed and discarded.
+    Bodies that are not arrays, or are already short enough, pass through.
+
+    Args:
+        body: Raw JSON response body
+        max_items: Number of leading elements to keep
+
+    Returns:
+        JSON body containing at most max_items elements
+    """
+    if max_items <= 0 or not body.lstrip().startswith(b"["):
+        return body
+
+    end = -1
+    for _ in range(max_items):
+        end = body.find(b",", end + 1)
+        if end == -1:
+            return body
+    return body[:end] + b"]"
+
+
+@dataclass(slots=True, frozen=True)
 class HackerNewsStory:
-    """Represents a Hacker News story."""
+    """Represents a Hacker News story (immutable, slotted for a compact footprint)."""
 
     id: int
     title: str
@@ -30,6 +110,14 @@ class HackerNewsStory:
     time: int
     descendants: int
     type: str = "story"
+    # ISO-formatted creation time, computed once for serialization
+    _created_at_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the ISO creation timestamp used by to_dict."""
+        object.__setattr__(
+            self, "_created_at_iso", datetime.fromtimestamp(self.time).isoformat()
+        )
 
     @property
     def created_at(self) -> datetime:
@@ -47,7 +135,7 @@ class HackerNewsStory:
             "time": self.time,
             "descendants": self.descendants,
             "type": self.type,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self._created_at_iso,
         }
 
 
@@ -63,41 +151,65 @@ class HackerNewsAPI:
         """
         self.base_url = base_url
         self.config = get_config()
+        self.algolia_url = self.config.hackernews.algolia_url
 
-        # Configure session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=self.config.hackernews.retry_attempts,
-            backoff_factor=self.config.hackernews.retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Reuse the process-wide session so connections stay warm across instances
+        self.session = _get_shared_session(self.config.hackernews)
 
-        # Set timeout
+        # Copy per-request settings onto the instance for the fetch hot path
         self.timeout = self.config.hackernews.timeout
+        self.max_concurrent_requests = self.config.hackernews.max_concurrent_requests
 
         logger.info(f"Initialized HN API client with base URL: {base_url}")
 
-    def _make_request(self, endpoint: str) -> Optional[Dict[str, Any]]:
+    def _make_request(
+        self, endpoint: str, max_items: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Make a request to the HN API.
 
         Args:
             endpoint: API endpoint to call
+            max_items: For array endpoints, only decode this many leading items
 
         Returns:
             JSON response data or None if failed
         """
-        url = f"{self.base_url}/{endpoint}"
+        return self._get_json(f"{self.base_url}/{endpoint}", max_items=max_items)
+
+    def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_items: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        GET a URL and decode its JSON body.
 
+        Args:
+            url: Full URL to fetch
+            params: Optional query string parameters
+            max_items: For flat array bodies, only decode this many leading items
+
+        Returns:
+            JSON response data or None if failed
+        """
         try:
             logger.debug(f"Making request to: {url}")
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
-            data = response.json()
+            if orjson is None and max_items is None:
+                # Without orjson, let requests decode (keeps its encoding detection)
+                data = response.json()
+            else:
+                body = response.content
+                if max_items is not None:
+                    body = _truncate_json_array(body, max_items)
+
+                # orjson parses the raw body directly, skipping requests' charset
+                # detection; truncated bodies use the stdlib decoder without it.
+                data = orjson.loads(body) if orjson else json.loads(body)
             logger.debug(f"Successfully fetched data from: {url}")
             return data
 
@@ -136,7 +248,7 @@ class HackerNewsAPI:
 
         logger.info(f"Fetching top {limit} story IDs")
 
-        data = self._make_request("topstories.json")
+        data = self._make_request("topstories.json", max_items=limit)
         if data is None:
             return None
 
@@ -165,11 +277,12 @@ class HackerNewsAPI:
             return None
 
         # Validate required fields
-        required_fields = ["id", "title", "score", "by", "time", "descendants"]
-        missing_fields = [field for field in required_fields if field not in data]
+        missing_fields = _REQUIRED_STORY_FIELDS.difference(data)
 
         if missing_fields:
-            logger.warning(f"Story {story_id} missing fields: {missing_fields}")
+            logger.warning(
+                f"Story {story_id} missing fields: {sorted(missing_fields)}"
+            )
             return None
 
         # Create story object
@@ -192,6 +305,51 @@ class HackerNewsAPI:
             logger.error(f"Error parsing story {story_id}: {e}")
             return None
 
+    def get_stories_batch(self, story_ids: List[int]) -> Dict[int, HackerNewsStory]:
+        """
+        Fetch details for many stories in one request via the HN Algolia API.
+
+        Args:
+            story_ids: Story IDs to look up
+
+        Returns:
+            Mapping of story ID to HackerNewsStory for every story found
+        """
+        if not story_ids:
+            return {}
+
+        logger.debug(f"Fetching {len(story_ids)} stories from Algolia")
+
+        id_tags = ",".join(f"story_{story_id}" for story_id in story_ids)
+        data = self._get_json(
+            f"{self.algolia_url}/search",
+            params={"tags": f"story,({id_tags})", "hitsPerPage": len(story_ids)},
+        )
+        if not isinstance(data, dict) or not isinstance(data.get("hits"), list):
+            logger.warning("Algolia batch lookup failed")
+            return {}
+
+        stories = {}
+        for hit in data["hits"]:
+            try:
+                story = HackerNewsStory(
+                    id=int(hit["objectID"]),
+                    title=hit["title"],
+                    url=hit.get("url") or None,  # Empty for Ask/Show HN text posts
+                    score=hit["points"],
+                    by=hit["author"],
+                    time=hit["created_at_i"],
+                    descendants=hit.get("num_comments") or 0,
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping unparseable Algolia hit: {e}")
+                continue
+
+            stories[story.id] = story
+
+        logger.debug(f"Algolia returned {len(stories)}/{len(story_ids)} stories")
+        return stories
+
     def get_top_stories(self, limit: Optional[int] = None) -> List[HackerNewsStory]:
         """
         Fetch complete details for top stories.
@@ -206,14 +364,33 @@ class HackerNewsAPI:
         if not story_ids:
             return []
 
+        logger.info(f"Fetching details for {len(story_ids)} stories")
+
+        # One Algolia query covers most stories; anything it misses falls back
+        # to the per-item Firebase endpoint.
+        stories_by_id = self.get_stories_batch(story_ids)
+        missing_ids = [
+            story_id for story_id in story_ids if story_id not in stories_by_id
+        ]
+
+        if missing_ids:
+            logger.info(f"Fetching {len(missing_ids)} stories individually")
+
+            # Story lookups are independent round-trips, so fetch them through
+            # a bounded worker pool
+            max_workers = min(self.max_concurrent_requests, len(missing_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for story_id, story in zip(
+                    missing_ids, executor.map(self.get_story_details, missing_ids)
+                ):
+                    if story:
+                        stories_by_id[story_id] = story
+
         stories = []
         failed_count = 0
 
-        logger.info(f"Fetching details for {len(story_ids)} stories")
-
         for i, story_id in enumerate(story_ids, 1):
-            story = self.get_story_details(story_id)
-
+            story = stories_by_id.get(story_id)
             if story:
                 stories.append(story)
                 logger.debug(f"Progress: {i}/{len(story_ids)} - {story.title}")
@@ -221,10 +398,6 @@ class HackerNewsAPI:
                 failed_count += 1
                 logger.warning(f"Failed to fetch story {story_id}")
 
-            # Add small delay to be respectful to the API
-            if i < len(story_ids):
-                time.sleep(0.1)
-
         logger.info(
             f"Successfully fetched {len(stories)} stories, {failed_count} failed"
         )
@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 
+import functools
 import sys
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from datetime import datetime
 
-from rich.console import Console
-from rich.table import Table
+from rich.console import Console, Group, RenderableType
+from rich.control import Control, ControlType
+from rich.segment import Segment, Segments
+from rich.table import Column, Table
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.text import Text
@@ -16,6 +19,156 @@ from story_selection import StorySelection, SelectableStory
 from hn_api import HackerNewsStory
 
 
+# ANSI erase sequences used when repainting a frame in place
+_ERASE_TO_END_OF_LINE = Control((ControlType.ERASE_IN_LINE, 0)).segment
+_ERASE_WHOLE_LINE = Control((ControlType.ERASE_IN_LINE, 2)).segment
+
+# Command aliases mapped to the name of the selector method that handles them
+_COMMAND_HANDLERS = {
+    'h': '_show_help',
+    'help': '_show_help',
+    's': '_toggle_current_story',
+    'select': '_toggle_current_story',
+    'd': '_deselect_current_story',
+    'deselect': '_deselect_current_story',
+    'a': '_select_all',
+    'all': '_select_all',
+    'n': '_deselect_all',
+    'none': '_deselect_all',
+    'i': '_invert_selection',
+    'invert': '_invert_selection',
+    'f': '_set_filter',
+    'filter': '_set_filter',
+    'p': '_preview_current_story',
+    'preview': '_preview_current_story',
+    'u': '_toggle_url_filter',
+    'urls': '_toggle_url_filter',
+    'score': '_select_by_score',
+    'recent': '_select_recent_stories',
+    'next': '_next_page',
+    '>': '_next_page',
+    'prev': '_previous_page',
+    '<': '_previous_page',
+}
+
+# Story table column definitions; each frame's table gets empty copies
+_STORY_TABLE_COLUMNS = (
+    Column("#", style="cyan", justify="right", width=3),
+    Column("Sel", justify="center", width=3),
+    Column("Title", style="white", min_width=40, max_width=60),
+    Column("Score", justify="right", style="green", width=5),
+    Column("Age", justify="right", style="yellow", width=4),
+    Column("Author", style="blue", width=15),
+    Column("URL", style="dim", width=3),
+)
+
+# Static renderables, built once so their markup is only parsed at import
+_INTRO_PANEL = Panel.fit(
+    "[bold blue]Interactive Story Selector[/bold blue]\n"
+    "Use arrow keys/hjkl to navigate, SPACE to toggle, ENTER to confirm\n"
+    "Press 'h' for help, 'q' to quit"
+)
+
+_FOOTER_TEXT = Text.from_markup(
+    "\n[dim][bold]Quick Commands:[/bold] "
+    "(s)elect • (a)ll • (n)one • (i)nvert • (f)ilter • (p)review • (u)rls • "
+    "(c)onfirm • (h)elp • (q)uit[/dim]"
+)
+
+_COMMAND_HINTS = Text.from_markup(
+    "\n[cyan]Commands:[/cyan] (s)elect/(d)eselect, (a)ll, (n)one, (i)nvert\n"
+    "[cyan]Advanced:[/cyan] (f)ilter, (p)review, (u)rls, score:N, hours:N, (h)elp\n"
+    "[cyan]Actions:[/cyan] (c)onfirm, (q)uit"
+)
+
+_HELP_TEXT = """
+[bold blue]Interactive Story Selector Help[/bold blue]
+
+[bold]Navigation:[/bold]
+• [cyan]<number>[/cyan] - Jump to story number
+• [cyan]next, >[/cyan] - Next page
+• [cyan]prev, <[/cyan] - Previous page
+
+[bold]Selection:[/bold]
+• [cyan]s, select[/cyan] - Toggle current story selection
+• [cyan]d, deselect[/cyan] - Deselect current story
+• [cyan]a, all[/cyan] - Select all filtered stories
+• [cyan]n, none[/cyan] - Deselect all filtered stories
+• [cyan]i, invert[/cyan] - Invert selection for filtered stories
+
+[bold]Smart Selection:[/bold]
+• [cyan]score[/cyan] - Select by minimum score (interactive)
+• [cyan]score:N[/cyan] - Select stories with score ≥ N
+• [cyan]recent[/cyan] - Select recent stories (interactive)
+• [cyan]hours:N[/cyan] - Select stories newer than N hours
+
+[bold]Filtering & Preview:[/bold]
+• [cyan]f, filter[/cyan] - Set text filter (searches title and author)
+• [cyan]u, urls[/cyan] - Toggle showing only stories with URLs
+• [cyan]p, preview[/cyan] - Preview current story details
+
+[bold]Actions:[/bold]
+• [cyan]c, confirm[/cyan] - Confirm selection and proceed
+• [cyan]h, help[/cyan] - Show this help
+• [cyan]q, quit[/cyan] - Cancel and quit
+
+[bold]Examples:[/bold]
+• [dim]score:100[/dim] - Select all stories with 100+ points
+• [dim]hours:6[/dim] - Select stories from last 6 hours
+• [dim]u[/dim] - Toggle filter to show only scrapable stories
+
+[bold]Legend:[/bold]
+• ✓ = Selected story    • ○ = Unselected story
+• 🔗 = Has URL         • ❌ = No URL (cannot scrape)
+
+Stories are [green]selected by default[/green]. Deselect stories you don't want to process.
+Only stories with URLs can be scraped for content.
+"""
+
+_HELP_PANEL = Panel(Text.from_markup(_HELP_TEXT), title="Help", border_style="blue")
+
+
+@functools.lru_cache(maxsize=256)
+def _format_age(age_hours: int) -> str:
+    """Format a story age in hours as a compact hours/days string."""
+    return f"{age_hours}h" if age_hours < 24 else f"{age_hours // 24}d"
+
+
+def _format_story_row(
+    story: SelectableStory, row_idx: int, is_current: bool, now: float
+) -> tuple:
+    """
+    Build the table cells for one story row.
+
+    Args:
+        story: Story to render
+        row_idx: 0-based index of the story in the filtered list
+        is_current: Whether the cursor is on this story
+        now: Reference timestamp for the age column
+
+    Returns:
+        Tuple of cell values in column order
+    """
+    # Selection indicator
+    sel_cell = "[green]✓[/green]" if story.selected else "[white]○[/white]"
+
+    # Title with current indicator
+    title = story.display_title
+    if is_current:
+        title = f"[reverse]{title}[/reverse]"
+
+    hn_story = story.story
+    return (
+        str(row_idx + 1),
+        sel_cell,
+        title,
+        str(hn_story.score),
+        _format_age(story.age_hours_at(now)),
+        hn_story.by[:14],
+        "🔗" if story.has_url else "❌",
+    )
+
+
 class InteractiveStorySelector:
     """Interactive story selector using Rich for terminal UI."""
 
@@ -33,6 +186,14 @@ class InteractiveStorySelector:
         self.cursor_position = 0
         self.filter_text = ""
         self.show_help = False
+        # Renderables for the frame being drawn, printed together in one pass
+        self._frame_buffer: List[RenderableType] = []
+        # Snapshot of the state shown by the last drawn frame (None forces a redraw)
+        self._last_frame_state: Optional[tuple] = None
+        # Feedback from the last command as (message, style), shown in the next frame
+        self._status_msg: Optional[Tuple[str, str]] = None
+        # Selection summary computed with the frame state, reused by the header
+        self._frame_summary: Optional[Dict[str, int]] = None
 
     def select_stories(self, stories: List[HackerNewsStory]) -> List[HackerNewsStory]:
         """
@@ -52,9 +213,12 @@ class InteractiveStorySelector:
             self.console.print("[red]No stories to select from![/red]")
             return []
 
-        # Validate story objects
+        # Validate story objects; real HN stories pass on a cheap isinstance
+        # check, anything else must at least carry the required attributes
         for i, story in enumerate(stories):
-            if not hasattr(story, 'id') or not hasattr(story, 'title'):
+            if not isinstance(story, HackerNewsStory) and (
+                not hasattr(story, 'id') or not hasattr(story, 'title')
+            ):
                 raise ValueError(f"Invalid story object at index {i}: missing required attributes")
 
         try:
@@ -63,11 +227,7 @@ class InteractiveStorySelector:
             self.console.print(f"[red]Error creating story selection: {e}[/red]")
             return []
 
-        self.console.print(Panel.fit(
-            "[bold blue]Interactive Story Selector[/bold blue]\n"
-            f"Use arrow keys/hjkl to navigate, SPACE to toggle, ENTER to confirm\n"
-            f"Press 'h' for help, 'q' to quit"
-        ))
+        self.console.print(_INTRO_PANEL)
 
         try:
             # Use simplified keyboard input for CLI compatibility
@@ -88,59 +248,34 @@ class InteractiveStorySelector:
 
             try:
                 # Get user input
-                self.console.print("\n[cyan]Commands:[/cyan] (s)elect/(d)eselect, (a)ll, (n)one, (i)nvert")
-                self.console.print("[cyan]Advanced:[/cyan] (f)ilter, (p)review, (u)rls, score:N, hours:N, (h)elp")
-                self.console.print("[cyan]Actions:[/cyan] (c)onfirm, (q)uit")
-
                 command = Prompt.ask("Enter command", default="h").lower().strip()
 
-                if command in ['q', 'quit']:
+                if command in ('q', 'quit'):
                     self.console.print("[yellow]Selection cancelled[/yellow]")
                     return []
-                elif command in ['c', 'confirm']:
+                elif command in ('c', 'confirm'):
                     return self._confirm_selection()
-                elif command in ['h', 'help']:
-                    self._show_help()
-                elif command in ['s', 'select']:
-                    self._toggle_current_story()
-                elif command in ['d', 'deselect']:
-                    self._deselect_current_story()
-                elif command in ['a', 'all']:
-                    self._select_all()
-                elif command in ['n', 'none']:
-                    self._deselect_all()
-                elif command in ['i', 'invert']:
-                    self._invert_selection()
-                elif command in ['f', 'filter']:
-                    self._set_filter()
-                elif command in ['p', 'preview']:
-                    self._preview_current_story()
-                elif command in ['u', 'urls']:
-                    self._toggle_url_filter()
-                elif command in ['score']:
-                    self._select_by_score()
-                elif command in ['recent']:
-                    self._select_recent_stories()
+                elif command in _COMMAND_HANDLERS:
+                    getattr(self, _COMMAND_HANDLERS[command])()
                 elif command.isdigit():
                     self._jump_to_story(int(command))
-                elif command in ['next', '>']:
-                    self._next_page()
-                elif command in ['prev', '<']:
-                    self._previous_page()
-                elif command.startswith('score:'):
-                    try:
-                        min_score = int(command.split(':')[1])
-                        self._select_by_score(min_score)
-                    except (ValueError, IndexError):
-                        self.console.print("[red]Invalid score format. Use 'score:number'[/red]")
-                elif command.startswith('hours:'):
-                    try:
-                        max_hours = int(command.split(':')[1])
-                        self._select_recent_stories(max_hours)
-                    except (ValueError, IndexError):
-                        self.console.print("[red]Invalid hours format. Use 'hours:number'[/red]")
                 else:
-                    self.console.print(f"[red]Unknown command: {command}[/red]")
+                    # Parameterized commands: score:N, hours:N
+                    name, sep, value = command.partition(':')
+                    if sep and name == 'score':
+                        try:
+                            min_score = int(value)
+                            self._select_by_score(min_score)
+                        except ValueError:
+                            self._set_status("Invalid score format. Use 'score:number'", "red")
+                    elif sep and name == 'hours':
+                        try:
+                            max_hours = int(value)
+                            self._select_recent_stories(max_hours)
+                        except ValueError:
+                            self._set_status("Invalid hours format. Use 'hours:number'", "red")
+                    else:
+                        self._set_status(f"Unknown command: {command}", "red")
 
             except (EOFError, KeyboardInterrupt):
                 self.console.print("\n[yellow]Selection cancelled[/yellow]")
@@ -151,8 +286,26 @@ class InteractiveStorySelector:
         if not self.selection:
             return
 
-        # Clear screen and show header
-        self.console.clear()
+        # Skip the rebuild when nothing on screen would change. A repeated status
+        # message is already shown, so drop it rather than leave it pending for
+        # a later frame.
+        frame_state = self._frame_state()
+        if frame_state == self._last_frame_state:
+            self._status_msg = None
+            return
+
+        self._last_frame_state = frame_state
+
+        self._draw_frame(self._build_frame())
+
+    def _build_frame(self) -> Group:
+        """
+        Build the whole selector screen as one renderable.
+
+        Returns:
+            Group of the header, stories table and footer
+        """
+        # Show header
         self._display_header()
 
         # Show stories table
@@ -161,12 +314,76 @@ class InteractiveStorySelector:
         # Show footer with summary
         self._display_footer()
 
+        frame = Group(*self._frame_buffer)
+        self._frame_buffer = []
+        return frame
+
+    def _draw_frame(self, frame: RenderableType) -> None:
+        """
+        Draw a frame over whatever is currently on screen.
+
+        On a terminal the frame is painted in place from the home position,
+        erasing stale text line by line, which avoids a full-screen clear and
+        the flicker and repaint cost that come with it. Frames taller than the
+        screen, and non-terminal output, fall back to clear-and-print.
+
+        Args:
+            frame: Renderable holding the whole frame
+        """
+        console = self.console
+        if not console.is_terminal:
+            console.clear()
+            console.print(frame)
+            return
+
+        lines = console.render_lines(frame, console.options, pad=False)
+        height = console.height
+        if len(lines) >= height:
+            # Hold the clear and the frame in Rich's buffer so they reach the
+            # terminal in a single write
+            with console:
+                console.clear()
+                console.print(frame)
+            return
+
+        segments = [Control.home().segment]
+        for line in lines:
+            segments.extend(line)
+            segments.append(_ERASE_TO_END_OF_LINE)
+            segments.append(Segment.line())
+
+        # Wipe the previous frame's leftovers and old command output below
+        for row in range(len(lines), height):
+            segments.append(Control.move_to(0, row).segment)
+            segments.append(_ERASE_WHOLE_LINE)
+        segments.append(Control.move_to(0, len(lines)).segment)
+
+        console.print(Segments(segments), end="")
+
+    def _frame_state(self) -> tuple:
+        """Get a snapshot of everything the current frame displays."""
+        filtered_stories = self.selection.filtered_stories
+        start_idx = self.current_page * self.page_size
+        page_stories = filtered_stories[start_idx:start_idx + self.page_size]
+        self._frame_summary = self.selection.get_selection_summary()
+
+        return (
+            self.current_page,
+            self.cursor_position,
+            self.filter_text,
+            self.selection._show_only_with_urls,
+            len(filtered_stories),
+            self._frame_summary["selected"],
+            tuple(story.selected for story in page_stories),
+            self._status_msg,
+        )
+
     def _display_header(self) -> None:
         """Display header with filters and summary."""
         if not self.selection:
             return
 
-        summary = self.selection.get_selection_summary()
+        summary = self._frame_summary or self.selection.get_selection_summary()
 
         header_text = f"[bold]HackerCast Story Selector[/bold] | "
         header_text += f"Total: {summary['total']} | "
@@ -176,7 +393,7 @@ class InteractiveStorySelector:
         if self.filter_text:
             header_text += f" | Filter: [yellow]'{self.filter_text}'[/yellow]"
 
-        self.console.print(Panel(header_text))
+        self._frame_buffer.append(Panel(header_text))
 
     def _display_stories_table(self) -> None:
         """Display stories in a table format."""
@@ -186,7 +403,9 @@ class InteractiveStorySelector:
         filtered_stories = self.selection.filtered_stories
 
         if not filtered_stories:
-            self.console.print("[yellow]No stories match current filters[/yellow]")
+            self._frame_buffer.append(
+                Text.from_markup("[yellow]No stories match current filters[/yellow]")
+            )
             return
 
         # Calculate pagination
@@ -194,61 +413,50 @@ class InteractiveStorySelector:
         end_idx = min(start_idx + self.page_size, len(filtered_stories))
         page_stories = filtered_stories[start_idx:end_idx]
 
-        # Create table
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("#", style="cyan", justify="right", width=3)
-        table.add_column("Sel", justify="center", width=3)
-        table.add_column("Title", style="white", min_width=40, max_width=60)
-        table.add_column("Score", justify="right", style="green", width=5)
-        table.add_column("Age", justify="right", style="yellow", width=4)
-        table.add_column("Author", style="blue", width=15)
-        table.add_column("URL", style="dim", width=3)
-
-        for i, story in enumerate(page_stories):
-            row_idx = start_idx + i
-            is_current = row_idx == self.cursor_position
-
-            # Selection indicator
-            sel_icon = "✓" if story.selected else "○"
-            sel_style = "green" if story.selected else "white"
-
-            # Title with current indicator
-            title = story.display_title
-            if is_current:
-                title = f"[reverse]{title}[/reverse]"
-
-            # Age display
-            age_text = f"{story.age_hours}h" if story.age_hours < 24 else f"{story.age_hours//24}d"
-
-            # URL indicator
-            url_icon = "🔗" if story.has_url else "❌"
-
-            table.add_row(
-                str(row_idx + 1),
-                f"[{sel_style}]{sel_icon}[/{sel_style}]",
-                title,
-                str(story.story.score),
-                age_text,
-                story.story.by[:14] if len(story.story.by) > 14 else story.story.by,
-                url_icon
-            )
+        # Create table from fresh copies of the prebuilt column definitions
+        table = Table(
+            *(column.copy() for column in _STORY_TABLE_COLUMNS),
+            show_header=True,
+            header_style="bold magenta",
+        )
+
+        # One clock read per frame for every row's age
+        cursor = self.cursor_position
+        now = datetime.now().timestamp()
+        for row_idx, story in enumerate(page_stories, start_idx):
+            table.add_row(*_format_story_row(story, row_idx, row_idx == cursor, now))
 
-        self.console.print(table)
+        self._frame_buffer.append(table)
 
         # Show pagination info
-        total_pages = (len(filtered_stories) + self.page_size - 1) // self.page_size
+        total_pages = self._total_pages()
         if total_pages > 1:
             page_info = f"Page {self.current_page + 1} of {total_pages}"
-            self.console.print(f"[dim]{page_info}[/dim]")
+            self._frame_buffer.append(Text(page_info, style="dim"))
+
+    def _total_pages(self) -> int:
+        """Get the number of pages of filtered stories."""
+        return (len(self.selection.filtered_stories) + self.page_size - 1) // self.page_size
 
     def _display_footer(self) -> None:
         """Display footer with quick commands."""
-        footer_text = (
-            "[bold]Quick Commands:[/bold] "
-            "(s)elect • (a)ll • (n)one • (i)nvert • (f)ilter • (p)review • (u)rls • "
-            "(c)onfirm • (h)elp • (q)uit"
-        )
-        self.console.print(f"\n[dim]{footer_text}[/dim]")
+        if self._status_msg:
+            message, style = self._status_msg
+            self._frame_buffer.append(Text(message, style=style))
+            self._status_msg = None
+
+        self._frame_buffer.append(_FOOTER_TEXT)
+        self._frame_buffer.append(_COMMAND_HINTS)
+
+    def _set_status(self, message: str, style: str) -> None:
+        """
+        Set the feedback line shown with the next frame.
+
+        Args:
+            message: Plain text message (not parsed as markup)
+            style: Rich style for the message
+        """
+        self._status_msg = (message, style)
 
     def _toggle_current_story(self) -> None:
         """Toggle selection of current story."""
@@ -259,7 +467,8 @@ class InteractiveStorySelector:
         if 0 <= self.cursor_position < len(filtered_stories):
             story = filtered_stories[self.cursor_position]
             story.toggle_selection()
-            self.console.print(f"[green]{'Selected' if story.selected else 'Deselected'}: {story.display_title}[/green]")
+            action = "Selected" if story.selected else "Deselected"
+            self._set_status(f"{action}: {story.display_title}", "green")
 
     def _deselect_current_story(self) -> None:
         """Deselect current story."""
@@ -271,7 +480,7 @@ class InteractiveStorySelector:
             story = filtered_stories[self.cursor_position]
             if story.selected:
                 story.selected = False
-                self.console.print(f"[yellow]Deselected: {story.display_title}[/yellow]")
+                self._set_status(f"Deselected: {story.display_title}", "yellow")
 
     def _select_all(self) -> None:
         """Select all filtered stories."""
@@ -279,7 +488,7 @@ class InteractiveStorySelector:
             return
 
         count = self.selection.select_all(filtered_only=True)
-        self.console.print(f"[green]Selected {count} additional stories[/green]")
+        self._set_status(f"Selected {count} additional stories", "green")
 
     def _deselect_all(self) -> None:
         """Deselect all filtered stories."""
@@ -287,7 +496,7 @@ class InteractiveStorySelector:
             return
 
         count = self.selection.deselect_all(filtered_only=True)
-        self.console.print(f"[yellow]Deselected {count} stories[/yellow]")
+        self._set_status(f"Deselected {count} stories", "yellow")
 
     def _invert_selection(self) -> None:
         """Invert selection for all filtered stories."""
@@ -295,12 +504,12 @@ class InteractiveStorySelector:
             return
 
         count = self.selection.invert_selection(filtered_only=True)
-        self.console.print(f"[blue]Inverted selection for {count} stories[/blue]")
+        self._set_status(f"Inverted selection for {count} stories", "blue")
 
     def _set_filter(self) -> None:
         """Set filter for stories."""
         if not self.selection:
-            self.console.print("[red]No selection available[/red]")
+            self._set_status("No selection available", "red")
             return
 
         try:
@@ -312,7 +521,7 @@ class InteractiveStorySelector:
 
             # Validate filter length
             if len(new_filter) > 100:
-                self.console.print("[red]Filter text too long (max 100 characters)[/red]")
+                self._set_status("Filter text too long (max 100 characters)", "red")
                 return
 
             self.selection.set_filter(new_filter)
@@ -322,12 +531,12 @@ class InteractiveStorySelector:
 
             filtered_count = len(self.selection.filtered_stories)
             if new_filter:
-                self.console.print(f"[blue]Filter applied: '{new_filter}' ({filtered_count} matches)[/blue]")
+                self._set_status(f"Filter applied: '{new_filter}' ({filtered_count} matches)", "blue")
             else:
-                self.console.print(f"[blue]Filter cleared ({filtered_count} stories)[/blue]")
+                self._set_status(f"Filter cleared ({filtered_count} stories)", "blue")
 
         except Exception as e:
-            self.console.print(f"[red]Error setting filter: {e}[/red]")
+            self._set_status(f"Error setting filter: {e}", "red")
 
     def _jump_to_story(self, story_number: int) -> None:
         """Jump to specific story number."""
@@ -342,34 +551,33 @@ class InteractiveStorySelector:
             self.cursor_position = target_idx
             # Calculate which page this story is on
             self.current_page = target_idx // self.page_size
-            self.console.print(f"[blue]Jumped to story #{story_number}[/blue]")
+            self._set_status(f"Jumped to story #{story_number}", "blue")
         else:
-            self.console.print(f"[red]Invalid story number: {story_number}[/red]")
+            self._set_status(f"Invalid story number: {story_number}", "red")
 
     def _next_page(self) -> None:
         """Go to next page."""
         if not self.selection:
             return
 
-        filtered_stories = self.selection.filtered_stories
-        total_pages = (len(filtered_stories) + self.page_size - 1) // self.page_size
+        total_pages = self._total_pages()
 
         if self.current_page < total_pages - 1:
             self.current_page += 1
             self.cursor_position = self.current_page * self.page_size
-            self.console.print(f"[blue]Next page ({self.current_page + 1}/{total_pages})[/blue]")
+            self._set_status(f"Next page ({self.current_page + 1}/{total_pages})", "blue")
         else:
-            self.console.print("[yellow]Already on last page[/yellow]")
+            self._set_status("Already on last page", "yellow")
 
     def _previous_page(self) -> None:
         """Go to previous page."""
         if self.current_page > 0:
             self.current_page -= 1
             self.cursor_position = self.current_page * self.page_size
-            total_pages = (len(self.selection.filtered_stories) + self.page_size - 1) // self.page_size
-            self.console.print(f"[blue]Previous page ({self.current_page + 1}/{total_pages})[/blue]")
+            total_pages = self._total_pages()
+            self._set_status(f"Previous page ({self.current_page + 1}/{total_pages})", "blue")
         else:
-            self.console.print("[yellow]Already on first page[/yellow]")
+            self._set_status("Already on first page", "yellow")
 
     def _preview_current_story(self) -> None:
         """Show preview of current story with URL and metadata."""
@@ -378,7 +586,7 @@ class InteractiveStorySelector:
 
         filtered_stories = self.selection.filtered_stories
         if not (0 <= self.cursor_position < len(filtered_stories)):
-            self.console.print("[yellow]No story selected for preview[/yellow]")
+            self._set_status("No story selected for preview", "yellow")
             return
 
         story = filtered_stories[self.cursor_position]
@@ -411,6 +619,7 @@ class InteractiveStorySelector:
         ))
 
         Prompt.ask("Press Enter to continue")
+        self._last_frame_state = None  # Preview covered the table
 
     def _toggle_url_filter(self) -> None:
         """Toggle URL filter on/off."""
@@ -426,7 +635,7 @@ class InteractiveStorySelector:
 
         status = "enabled" if not current_state else "disabled"
         filtered_count = len(self.selection.filtered_stories)
-        self.console.print(f"[blue]URL filter {status} ({filtered_count} stories shown)[/blue]")
+        self._set_status(f"URL filter {status} ({filtered_count} stories shown)", "blue")
 
     def _select_by_score(self, min_score: Optional[int] = None) -> None:
         """Select stories by minimum score."""
@@ -438,15 +647,15 @@ class InteractiveStorySelector:
             try:
                 min_score = int(min_score_str)
             except ValueError:
-                self.console.print("[red]Invalid score. Please enter a number.[/red]")
+                self._set_status("Invalid score. Please enter a number.", "red")
                 return
 
         if min_score < 0:
-            self.console.print("[red]Score must be non-negative[/red]")
+            self._set_status("Score must be non-negative", "red")
             return
 
         count = self.selection.select_by_criteria(min_score=min_score)
-        self.console.print(f"[green]Selected {count} additional stories with score ≥ {min_score}[/green]")
+        self._set_status(f"Selected {count} additional stories with score ≥ {min_score}", "green")
 
     def _select_recent_stories(self, max_hours: Optional[int] = None) -> None:
         """Select stories newer than specified hours."""
@@ -458,63 +667,21 @@ class InteractiveStorySelector:
             try:
                 max_hours = int(max_hours_str)
             except ValueError:
-                self.console.print("[red]Invalid hours. Please enter a number.[/red]")
+                self._set_status("Invalid hours. Please enter a number.", "red")
                 return
 
         if max_hours < 0:
-            self.console.print("[red]Hours must be non-negative[/red]")
+            self._set_status("Hours must be non-negative", "red")
             return
 
         count = self.selection.select_by_criteria(max_age_hours=max_hours)
-        self.console.print(f"[green]Selected {count} additional stories newer than {max_hours} hours[/green]")
+        self._set_status(f"Selected {count} additional stories newer than {max_hours} hours", "green")
 
     def _show_help(self) -> None:
         """Show help information."""
-        help_text = """
-[bold blue]Interactive Story Selector Help[/bold blue]
-
-[bold]Navigation:[/bold]
-• [cyan]<number>[/cyan] - Jump to story number
-• [cyan]next, >[/cyan] - Next page
-• [cyan]prev, <[/cyan] - Previous page
-
-[bold]Selection:[/bold]
-• [cyan]s, select[/cyan] - Toggle current story selection
-• [cyan]d, deselect[/cyan] - Deselect current story
-• [cyan]a, all[/cyan] - Select all filtered stories
-• [cyan]n, none[/cyan] - Deselect all filtered stories
-• [cyan]i, invert[/cyan] - Invert selection for filtered stories
-
-[bold]Smart Selection:[/bold]
-• [cyan]score[/cyan] - Select by minimum score (interactive)
-• [cyan]score:N[/cyan] - Select stories with score ≥ N
-• [cyan]recent[/cyan] - Select recent stories (interactive)
-• [cyan]hours:N[/cyan] - Select stories newer than N hours
-
-[bold]Filtering & Preview:[/bold]
-• [cyan]f, filter[/cyan] - Set text filter (searches title and author)
-• [cyan]u, urls[/cyan] - Toggle showing only stories with URLs
-• [cyan]p, preview[/cyan] - Preview current story details
-
-[bold]Actions:[/bold]
-• [cyan]c, confirm[/cyan] - Confirm selection and proceed
-• [cyan]h, help[/cyan] - Show this help
-• [cyan]q, quit[/cyan] - Cancel and quit
-
-[bold]Examples:[/bold]
-• [dim]score:100[/dim] - Select all stories with 100+ points
-• [dim]hours:6[/dim] - Select stories from last 6 hours
-• [dim]u[/dim] - Toggle filter to show only scrapable stories
-
-[bold]Legend:[/bold]
-• ✓ = Selected story    • ○ = Unselected story
-• 🔗 = Has URL         • ❌ = No URL (cannot scrape)
-
-Stories are [green]selected by default[/green]. Deselect stories you don't want to process.
-Only stories with URLs can be scraped for content.
-"""
-        self.console.print(Panel(help_text, title="Help", border_style="blue"))
+        self.console.print(_HELP_PANEL)
         Prompt.ask("Press Enter to continue")
+        self._last_frame_state = None  # Help covered the table
 
     def _confirm_selection(self) -> List[HackerNewsStory]:
         """Confirm current selection and return selected stories."""
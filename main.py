@@ -1,11 +1,17 @@
 #!/usr/bin/env python
 
+import hashlib
 import json
 import logging
 import logging.config
+import os
 import sys
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -18,16 +24,22 @@ from rich.progress import (
     BarColumn,
     TimeElapsedColumn,
 )
+from rich.prompt import Confirm
 from rich.table import Table
 from rich.logging import RichHandler
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 from config import initialize_config, get_config_manager
 from hn_api import HackerNewsAPI, HackerNewsStory
 from scraper import ArticleScraper, ScrapedContent
-from tts_converter import TTSConverter
 from interactive_selector import InteractiveStorySelector
 from podcast_publisher import PodcastPublisher, PodcastPublisherConfig
 from podcast_chapters import create_chapter_file
+from rss_generator import RSSFeedGenerator
 
 # Initialize rich console
 console = Console()
@@ -35,6 +47,25 @@ console = Console()
 # Global application state
 app_start_time = datetime.now()
 
+# Reads the fields a story needs for selection; raises AttributeError if any is missing
+_read_selection_fields = attrgetter("id", "title", "score")
+
+
+def _ellipsize(text: Optional[str], max_length: int) -> str:
+    """
+    Shorten text for display, marking truncation with an ellipsis.
+
+    Args:
+        text: Text to shorten
+        max_length: Maximum number of characters kept before the ellipsis
+
+    Returns:
+        The shortened text, or "N/A" if there is none
+    """
+    if not text:
+        return "N/A"
+    return text if len(text) <= max_length else text[:max_length] + "..."
+
 
 class HackerCastPipeline:
     """Main orchestrator for the HackerCast pipeline."""
@@ -55,7 +86,9 @@ class HackerCastPipeline:
 
         # Initialize components
         self.hn_api = HackerNewsAPI()
-        self.scraper = ArticleScraper()
+        self.scraper = ArticleScraper(
+            cache_dir=Path(self.config.output.base_dir) / self.config.output.cache_dir
+        )
         self.tts_converter = None  # Initialize when needed
         self.podcast_publisher = None  # Initialize when needed
 
@@ -68,6 +101,8 @@ class HackerCastPipeline:
         self.audio_files: List[Path] = []
         self.chapters: List[Dict[str, Any]] = []
         self.chapter_file: Optional[Path] = None
+        # Set when a full run starts so every dated output shares one clock read
+        self.run_started: Optional[datetime] = None
 
     def _setup_logging(self):
         """Configure logging based on configuration."""
@@ -80,28 +115,54 @@ class HackerCastPipeline:
             rich_handler.setLevel(logging.DEBUG)
             logging.getLogger().addHandler(rich_handler)
 
+    def _run_time(self) -> datetime:
+        """Get the current run's start time, or now outside of a full run."""
+        return self.run_started or datetime.now()
+
+    def _hide_progress(self) -> bool:
+        """Whether progress bars should be skipped (quiet mode or no terminal)."""
+        return self.config.quiet or not console.is_terminal
+
     def _initialize_tts(self):
         """Initialize TTS converter when needed."""
         if self.tts_converter is None:
             try:
+                # Deferred so commands that never synthesize audio skip loading
+                # the Google Cloud client libraries
+                from tts_converter import TTSConverter
+
                 self.tts_converter = TTSConverter(
-                    credentials_path=self.config.google_credentials_path
+                    credentials_path=self.config.google_credentials_path,
+                    max_concurrent_requests=self.config.tts.max_concurrent_requests,
+                    cache_dir=(
+                        Path(self.config.output.base_dir)
+                        / self.config.output.cache_dir
+                        / "tts"
+                    ),
+                    cache_ttl_hours=self.config.tts.cache_ttl_hours,
                 )
                 self.logger.info("TTS converter initialized")
             except Exception as e:
                 self.logger.error(f"Failed to initialize TTS converter: {e}")
                 raise
 
+    @cached_property
+    def publisher_config(self) -> PodcastPublisherConfig:
+        """
+        Podcast publishing settings, built once on first use.
+
+        Raises:
+            ValueError: If no Transistor API key is configured
+        """
+        return PodcastPublisherConfig(vars(self.config.podcast_publishing))
+
     def _initialize_publisher(self):
         """Initialize podcast publisher when needed."""
         if self.podcast_publisher is None:
             try:
-                publisher_config = PodcastPublisherConfig(
-                    self.config.podcast_publishing.__dict__ if hasattr(self.config, 'podcast_publishing') else {}
-                )
                 self.podcast_publisher = PodcastPublisher(
-                    api_key=publisher_config.api_key,
-                    base_url=publisher_config.base_url
+                    api_key=self.publisher_config.api_key,
+                    base_url=self.publisher_config.base_url
                 )
                 self.logger.info("Podcast publisher initialized")
             except Exception as e:
@@ -129,6 +190,7 @@ class HackerCastPipeline:
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            disable=self._hide_progress(),
         ) as progress:
             task = progress.add_task("Fetching stories...", total=None)
 
@@ -143,28 +205,26 @@ class HackerCastPipeline:
                     task, description=f"Fetched {len(self.stories)} stories"
                 )
 
-                # Display stories table
-                table = Table(title="Top Hacker News Stories")
-                table.add_column("ID", style="cyan")
-                table.add_column("Title", style="white", max_width=50)
-                table.add_column("Score", justify="right", style="green")
-                table.add_column("Author", style="yellow")
-                table.add_column("URL", style="blue", max_width=30)
-
-                for story in self.stories[:10]:  # Show first 10
-                    table.add_row(
-                        str(story.id),
-                        story.title,
-                        str(story.score),
-                        story.by,
-                        (
-                            story.url[:30] + "..."
-                            if story.url and len(story.url) > 30
-                            else story.url or "N/A"
-                        ),
-                    )
+                # Tables are only worth building when someone is watching
+                if console.is_terminal:
+                    table = Table(title="Top Hacker News Stories")
+                    table.add_column("ID", style="cyan")
+                    table.add_column("Title", style="white", max_width=50)
+                    table.add_column("Score", justify="right", style="green")
+                    table.add_column("Author", style="yellow")
+                    table.add_column("URL", style="blue", max_width=30)
+
+                    for story in self.stories[:10]:  # Show first 10
+                        table.add_row(
+                            str(story.id),
+                            story.title,
+                            str(story.score),
+                            story.by,
+                            _ellipsize(story.url, 30),
+                        )
+
+                    console.print(table)
 
-                console.print(table)
                 self.logger.info(f"Successfully fetched {len(self.stories)} stories")
 
                 return self.stories
@@ -201,13 +261,15 @@ class HackerCastPipeline:
         valid_stories = []
         for story in stories:
             try:
-                # Check required attributes
-                if hasattr(story, 'id') and hasattr(story, 'title') and hasattr(story, 'score'):
-                    valid_stories.append(story)
-                else:
-                    self.logger.warning(f"Invalid story object: missing required attributes")
+                # Read the required fields directly; only foreign objects lack them
+                _read_selection_fields(story)
+            except AttributeError:
+                self.logger.warning("Invalid story object: missing required attributes")
+                continue
             except Exception as e:
                 self.logger.warning(f"Error validating story: {e}")
+                continue
+            valid_stories.append(story)
 
         if not valid_stories:
             console.print("[red]No valid stories found for selection![/red]")
@@ -250,11 +312,9 @@ class HackerCastPipeline:
         except Exception as e:
             console.print(f"[red]Error in interactive selection: {e}[/red]")
             self.logger.error(f"Error in interactive selection: {e}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
 
             # Ask user if they want to proceed with all stories or cancel
-            from rich.prompt import Confirm
             try:
                 fallback = Confirm.ask("Selection failed. Proceed with all stories?", default=False)
                 if fallback:
@@ -280,25 +340,36 @@ class HackerCastPipeline:
         """
         validated = []
         for story in stories:
+            try:
+                # Read the fields directly; only foreign objects lack them
+                story_id, title, score = story.id, story.title, story.score
+                url = getattr(story, 'url', None)
+            except AttributeError as e:
+                self.logger.warning(f"Invalid story object: {e}")
+                continue
+            except Exception as e:
+                # e.g. a property that raises; keep validating the rest
+                self.logger.error(f"Error validating story: {e}")
+                continue
+
             try:
                 # Check basic attributes
-                if not hasattr(story, 'id') or not story.id:
-                    self.logger.warning(f"Story missing ID: {getattr(story, 'title', 'Unknown')}")
+                if not story_id:
+                    self.logger.warning(f"Story missing ID: {title or 'Unknown'}")
                     continue
 
-                if not hasattr(story, 'title') or not story.title.strip():
-                    self.logger.warning(f"Story {story.id} missing title")
+                if not title.strip():
+                    self.logger.warning(f"Story {story_id} missing title")
                     continue
 
-                if not hasattr(story, 'score') or story.score < 0:
-                    self.logger.warning(f"Story {story.id} has invalid score")
+                if score < 0:
+                    self.logger.warning(f"Story {story_id} has invalid score")
                     continue
 
                 # URL is optional but if present should be valid
-                if hasattr(story, 'url') and story.url:
-                    if not story.url.startswith(('http://', 'https://')):
-                        self.logger.warning(f"Story {story.id} has invalid URL format")
-                        # Don't skip the story, just note the issue
+                if url and not url.startswith(('http://', 'https://')):
+                    self.logger.warning(f"Story {story_id} has invalid URL format")
+                    # Don't skip the story, just note the issue
 
                 validated.append(story)
 
@@ -308,13 +379,16 @@ class HackerCastPipeline:
         return validated
 
     def scrape_articles(
-        self, stories: Optional[List[HackerNewsStory]] = None
+        self,
+        stories: Optional[List[HackerNewsStory]] = None,
+        force_rescrape: bool = False,
     ) -> List[ScrapedContent]:
         """
         Scrape article content from stories.
 
         Args:
             stories: List of stories to scrape (uses self.stories if None)
+            force_rescrape: Bypass the scraped article cache
 
         Returns:
             List of ScrapedContent objects
@@ -332,8 +406,6 @@ class HackerCastPipeline:
             f"[bold blue]Scraping {len(stories_with_urls)} articles...[/bold blue]"
         )
 
-        scraped_content = []
-
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -341,38 +413,60 @@ class HackerCastPipeline:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
             console=console,
+            disable=self._hide_progress(),
         ) as progress:
             task = progress.add_task(
                 "Scraping articles...", total=len(stories_with_urls)
             )
 
-            for i, story in enumerate(stories_with_urls):
-                try:
-                    progress.update(
-                        task, description=f"Scraping: {story.title[:30]}..."
-                    )
+            # Scraping is network-bound, so fetch articles through a bounded
+            # worker pool and collect results back in story order
+            max_workers = min(
+                self.config.scraping.max_concurrent_requests,
+                max(len(stories_with_urls), 1),
+            )
+            results: Dict[int, ScrapedContent] = {}
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self.scraper.scrape_article,
+                        story.url,
+                        force_refresh=force_rescrape,
+                    ): i
+                    for i, story in enumerate(stories_with_urls)
+                }
+
+                for future in as_completed(futures):
+                    i = futures[future]
+                    story = stories_with_urls[i]
+                    try:
+                        content = future.result()
+                        if content:
+                            # Add story metadata to content
+                            content.title = story.title  # Use HN title if different
+                            results[i] = content
+                            self.logger.debug(f"Scraped: {story.title}")
+                        else:
+                            self.logger.warning(f"Failed to scrape: {story.title}")
 
-                    content = self.scraper.scrape_article(story.url)
-                    if content:
-                        # Add story metadata to content
-                        content.title = story.title  # Use HN title if different
-                        scraped_content.append(content)
-                        self.logger.debug(f"Scraped: {story.title}")
-                    else:
-                        self.logger.warning(f"Failed to scrape: {story.title}")
+                    except Exception as e:
+                        self.logger.error(f"Error scraping {story.title}: {e}")
 
-                    progress.advance(task)
+                    progress.update(
+                        task,
+                        advance=1,
+                        description=f"Scraped: {_ellipsize(story.title, 30)}",
+                    )
 
-                except Exception as e:
-                    self.logger.error(f"Error scraping {story.title}: {e}")
-                    progress.advance(task)
+            scraped_content = [results[i] for i in sorted(results)]
 
         console.print(
             f"[green]Successfully scraped {len(scraped_content)} articles[/green]"
         )
 
         # Display scraping results
-        if scraped_content:
+        if scraped_content and console.is_terminal:
             table = Table(title="Scraped Articles")
             table.add_column("Title", style="white", max_width=40)
             table.add_column("Words", justify="right", style="green")
@@ -381,11 +475,7 @@ class HackerCastPipeline:
 
             for content in scraped_content[:10]:  # Show first 10
                 table.add_row(
-                    (
-                        content.title[:40] + "..."
-                        if len(content.title) > 40
-                        else content.title
-                    ),
+                    _ellipsize(content.title, 40),
                     str(content.word_count),
                     content.scraping_method,
                     content.author or "Unknown",
@@ -415,7 +505,7 @@ class HackerCastPipeline:
         # Introduction
         intro_text = (
             f"Welcome to HackerCast, your daily digest of the top stories from Hacker News. "
-            f"Today is {datetime.now().strftime('%B %d, %Y')}, and we have {len(content)} "
+            f"Today is {self._run_time().strftime('%B %d, %Y')}, and we have {len(content)} "
             f"fascinating stories to share with you."
         )
         segments.append({"title": "Introduction", "text": intro_text})
@@ -453,7 +543,9 @@ class HackerCastPipeline:
 
         try:
             self._initialize_tts()
-            audio_file = self.config_manager.get_dated_output_path("audio", "mp3")
+            audio_file = self.config_manager.get_dated_output_path(
+                "audio", "mp3", self._run_time().strftime("%Y%m%d")
+            )
 
             audio_path, chapters = self.tts_converter.convert_segments_to_audio(
                 segments=segments,
@@ -510,24 +602,44 @@ class HackerCastPipeline:
             self.logger.error(f"Error generating chapter file: {e}")
             return None
 
-    def save_pipeline_data(self) -> Path:
+    def _pipeline_stats(self) -> Dict[str, int]:
+        """
+        Summarize the current pipeline state.
+
+        Returns:
+            Counts of fetched stories, scraped articles, words and audio files
+        """
+        return {
+            "stories_fetched": len(self.stories),
+            "articles_scraped": len(self.scraped_content),
+            "total_words": sum(content.word_count for content in self.scraped_content),
+            "audio_files_generated": len(self.audio_files),
+        }
+
+    def save_pipeline_data(self, stats: Optional[Dict[str, int]] = None) -> Path:
         """
         Save all pipeline data to JSON file.
 
+        Args:
+            stats: Precomputed pipeline stats (computed from current state if None)
+
         Returns:
             Path to saved data file
         """
         console.print("[bold blue]Saving pipeline data...[/bold blue]")
 
-        # Use date-based directory and latest naming for pipeline data
-        data_file = self.config_manager.get_dated_output_path("data", "json")
+        # Stamp the data with the run's start time so it lands in the same
+        # dated directory as the audio, even if the run crosses midnight
+        now = self._run_time()
 
-        # Generate timestamp for metadata
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Use date-based directory and latest naming for pipeline data
+        data_file = self.config_manager.get_dated_output_path(
+            "data", "json", now.strftime("%Y%m%d")
+        )
 
         pipeline_data = {
-            "timestamp": timestamp,
-            "run_date": datetime.now().isoformat(),
+            "timestamp": now.strftime("%Y%m%d_%H%M%S"),
+            "run_date": now.isoformat(),
             "config": {
                 "environment": self.config.environment,
                 "max_stories": self.config.hackernews.max_stories,
@@ -538,18 +650,23 @@ class HackerCastPipeline:
             "audio_files": [str(file) for file in self.audio_files],
             "chapters": self.chapters,
             "chapter_file": str(self.chapter_file) if self.chapter_file else None,
-            "stats": {
-                "stories_fetched": len(self.stories),
-                "articles_scraped": len(self.scraped_content),
-                "total_words": sum(
-                    content.word_count for content in self.scraped_content
-                ),
-                "audio_files_generated": len(self.audio_files),
-            },
+            "stats": stats if stats is not None else self._pipeline_stats(),
         }
 
-        with open(data_file, "w", encoding="utf-8") as f:
-            json.dump(pipeline_data, f, indent=2, ensure_ascii=False)
+        # orjson encodes straight to UTF-8 bytes; fall back to the stdlib encoder
+        if orjson:
+            body = orjson.dumps(
+                pipeline_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        else:
+            body = json.dumps(pipeline_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        # Write beside the target and rename, so an interrupted run never leaves
+        # a truncated latest.json for the RSS generator to read
+        tmp_file = data_file.with_name(f"{data_file.name}.tmp")
+        tmp_file.write_bytes(body)
+        os.replace(tmp_file, data_file)
 
         console.print(f"[green]Pipeline data saved: {data_file}[/green]")
         self.logger.info(f"Saved pipeline data to: {data_file}")
@@ -566,8 +683,6 @@ class HackerCastPipeline:
         console.print("[bold blue]Generating RSS feed...[/bold blue]")
 
         try:
-            from rss_generator import RSSFeedGenerator
-
             # Determine base URL (use environment variable or default)
             base_url = os.getenv('HACKERCAST_BASE_URL', 'http://localhost:5000')
 
@@ -595,6 +710,69 @@ class HackerCastPipeline:
             self.logger.warning(f"Failed to generate RSS feed: {e}")
             return None
 
+    @property
+    def _last_episode_path(self) -> Path:
+        """Path of the record describing the most recently published episode."""
+        return (
+            Path(self.config.output.base_dir)
+            / self.config.output.cache_dir
+            / "last_episode.json"
+        )
+
+    @staticmethod
+    def _episode_fingerprint(audio_file: Path, title: str, description: str) -> str:
+        """
+        Fingerprint an episode by its metadata and audio content.
+
+        Args:
+            audio_file: Path to the episode audio
+            title: Episode title
+            description: Episode description
+
+        Returns:
+            Hex digest identifying this exact episode
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(title.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(description.encode("utf-8"))
+        digest.update(b"\0")
+        # Hash the audio bytes rather than path/mtime: every rerun writes a new,
+        # dated file even when the synthesized audio is identical
+        with open(audio_file, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _load_last_episode(self) -> Optional[Dict[str, Any]]:
+        """Load the last published episode record, or None if unavailable."""
+        try:
+            with open(self._last_episode_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable last episode record: {e}")
+            return None
+
+    def _store_last_episode(self, fingerprint: str, result: Dict[str, Any]) -> None:
+        """
+        Record a successful publish so an identical rerun can skip the upload.
+
+        Args:
+            fingerprint: Episode fingerprint from _episode_fingerprint
+            result: Publishing result returned by the podcast publisher
+        """
+        path = self._last_episode_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "result": result}, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to record last published episode: {e}")
+
     def publish_to_podcast_host(
         self,
         audio_file: Path,
@@ -615,21 +793,36 @@ class HackerCastPipeline:
         console.print("[bold blue]Publishing episode to podcast host...[/bold blue]")
 
         try:
-            self._initialize_publisher()
-
             # Generate episode metadata
-            today = datetime.now()
-            title = f"HackerCast - {today.strftime('%B %d, %Y')}"
-            summary = f"Daily digest of the top {story_count} Hacker News stories for {today.strftime('%B %d, %Y')}."
+            # Date the episode by the run's start so it matches the intro
+            today = self._run_time()
+            today_str = today.strftime('%B %d, %Y')
+            title = f"HackerCast - {today_str}"
+            summary = f"Daily digest of the top {story_count} Hacker News stories for {today_str}."
+            description = f"{summary}\n\nStories covered:\n" + "\n".join(
+                f"- {story.title}" for story in self.stories[:10]
+            )
 
             # Calculate episode number based on date (days since epoch)
             epoch_date = datetime(2024, 1, 1)  # Adjust based on when you started
             episode_number = (today.date() - epoch_date.date()).days
 
-            # Get publisher config
-            publisher_config = PodcastPublisherConfig(
-                self.config.podcast_publishing.__dict__ if hasattr(self.config, 'podcast_publishing') else {}
-            )
+            # Skip the upload when this exact episode was already published
+            fingerprint = self._episode_fingerprint(audio_file, title, description)
+            last_episode = self._load_last_episode()
+            if last_episode and last_episode.get("fingerprint") == fingerprint:
+                result = last_episode["result"]
+                console.print(
+                    f"[yellow]Episode unchanged since last publish, skipping upload "
+                    f"(Episode ID: {result.get('episode_id')})[/yellow]"
+                )
+                self.logger.info(
+                    f"Skipped republishing unchanged episode {result.get('episode_id')}"
+                )
+                return result
+
+            self._initialize_publisher()
+            publisher_config = self.publisher_config
 
             if not publisher_config.default_show_id:
                 console.print("[yellow]No default show ID configured. Listing available shows...[/yellow]")
@@ -648,9 +841,7 @@ class HackerCastPipeline:
                 title=title,
                 summary=summary,
                 episode_number=episode_number,
-                description=f"{summary}\n\nStories covered:\n" + "\n".join(
-                    f"- {story.title}" for story in self.stories[:10]
-                ),
+                description=description,
                 auto_publish=publisher_config.auto_publish
             )
 
@@ -661,6 +852,7 @@ class HackerCastPipeline:
                     console.print(f"[cyan]Episode URL: {result['episode_url']}[/cyan]")
 
                 self.logger.info(f"Published episode {result['episode_id']} to podcast host")
+                self._store_last_episode(fingerprint, result)
                 return result
             else:
                 console.print(f"[red]Failed to publish episode: {result['error']}[/red]")
@@ -671,19 +863,26 @@ class HackerCastPipeline:
             self.logger.error(f"Error publishing to podcast host: {e}")
             return None
 
-    def run_full_pipeline(self, limit: Optional[int] = None, interactive: bool = False) -> Dict[str, Any]:
+    def run_full_pipeline(
+        self,
+        limit: Optional[int] = None,
+        interactive: bool = False,
+        force_rescrape: bool = False,
+    ) -> Dict[str, Any]:
         """
         Run the complete HackerCast pipeline.
 
         Args:
             limit: Number of stories to process
             interactive: Whether to use interactive story selection
+            force_rescrape: Re-fetch articles even if they are cached
 
         Returns:
             Pipeline results summary
         """
         console.print("[bold magenta]Starting HackerCast Pipeline[/bold magenta]")
         pipeline_start = time.time()
+        self.run_started = datetime.now()
 
         try:
             # Step 1: Fetch stories
@@ -698,7 +897,7 @@ class HackerCastPipeline:
                     raise ValueError("No stories selected")
 
             # Step 3: Scrape articles
-            content = self.scrape_articles(stories)
+            content = self.scrape_articles(stories, force_rescrape=force_rescrape)
             if not content:
                 raise ValueError("No articles scraped")
 
@@ -721,8 +920,9 @@ class HackerCastPipeline:
                 # In a future iteration, we could generate a summary.
                 episode_info = self.publish_to_podcast_host(audio_file, "", len(stories))
 
-            # Step 6: Save pipeline data
-            data_file = self.save_pipeline_data()
+            # Step 6: Save pipeline data, sharing the stats with the summary
+            stats = self._pipeline_stats()
+            data_file = self.save_pipeline_data(stats)
 
             # Step 7: Generate RSS feed
             rss_file = self.generate_rss_feed()
@@ -731,13 +931,13 @@ class HackerCastPipeline:
             runtime = time.time() - pipeline_start
 
             # Display summary
-            self._display_pipeline_summary(runtime, audio_file is not None)
+            self._display_pipeline_summary(runtime, audio_file is not None, stats)
 
             return {
                 "success": True,
                 "stories_count": len(stories),
                 "scraped_count": len(content),
-                "script_length": len(script),
+                "script_length": sum(len(segment["text"]) for segment in segments),
                 "audio_file": str(audio_file) if audio_file else None,
                 "episode_info": episode_info,
                 "data_file": str(data_file),
@@ -753,18 +953,38 @@ class HackerCastPipeline:
                 "runtime": time.time() - pipeline_start,
             }
 
-    def _display_pipeline_summary(self, runtime: float, audio_success: bool):
+    def _display_pipeline_summary(
+        self,
+        runtime: float,
+        audio_success: bool,
+        stats: Optional[Dict[str, int]] = None,
+    ):
         """Display pipeline execution summary."""
+        if stats is None:
+            stats = self._pipeline_stats()
+
+        if not console.is_terminal:
+            self.logger.info(
+                f"Pipeline summary: {stats['stories_fetched']} stories, "
+                f"{stats['articles_scraped']} articles, {stats['total_words']} words, "
+                f"audio {'generated' if audio_success else 'not generated'}, "
+                f"{runtime:.2f}s"
+            )
+            return
+
         table = Table(title="Pipeline Summary", show_header=False)
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="white")
 
-        table.add_row("Stories Fetched", str(len(self.stories)))
-        table.add_row("Articles Scraped", str(len(self.scraped_content)))
-        table.add_row(
-            "Total Words", str(sum(c.word_count for c in self.scraped_content))
-        )
+        table.add_row("Stories Fetched", str(stats["stories_fetched"]))
+        table.add_row("Articles Scraped", str(stats["articles_scraped"]))
+        table.add_row("Total Words", str(stats["total_words"]))
         table.add_row("Audio Generated", "Yes" if audio_success else "No")
+        if self.tts_converter and self.config.tts.cache_ttl_hours:
+            hits = self.tts_converter.cache_hits
+            table.add_row(
+                "TTS Cache Hits", f"{hits}/{hits + self.tts_converter.cache_misses}"
+            )
         table.add_row("Runtime", f"{runtime:.2f} seconds")
 
         console.print(table)
@@ -779,16 +999,36 @@ class HackerCastPipeline:
             self.logger.error(f"Error during cleanup: {e}")
 
 
+def _create_pipeline(ctx: click.Context) -> HackerCastPipeline:
+    """
+    Create a pipeline with the global CLI flags applied.
+
+    Args:
+        ctx: Click context populated by the cli group
+
+    Returns:
+        Configured HackerCastPipeline
+    """
+    pipeline = HackerCastPipeline(ctx.obj["config"])
+    if ctx.obj["debug"]:
+        pipeline.config.debug = True
+    if ctx.obj["quiet"]:
+        pipeline.config.quiet = True
+    return pipeline
+
+
 # CLI Interface
 @click.group()
 @click.option("--config", help="Configuration file path")
 @click.option("--debug", is_flag=True, help="Enable debug mode")
+@click.option("--quiet", "-q", is_flag=True, help="Hide progress bars")
 @click.pass_context
-def cli(ctx, config, debug):
+def cli(ctx, config, debug, quiet):
     """HackerCast: Generate daily podcasts from Hacker News stories."""
     ctx.ensure_object(dict)
     ctx.obj["config"] = config
     ctx.obj["debug"] = debug
+    ctx.obj["quiet"] = quiet
 
 
 @cli.command()
@@ -798,16 +1038,19 @@ def cli(ctx, config, debug):
 @click.option(
     "--interactive", "-i", is_flag=True, help="Use interactive story selection"
 )
+@click.option(
+    "--force-rescrape", is_flag=True, help="Ignore cached articles and scrape again"
+)
 @click.pass_context
-def run(ctx, limit, interactive):
+def run(ctx, limit, interactive, force_rescrape):
     """Run the complete HackerCast pipeline."""
     pipeline = None
     try:
-        pipeline = HackerCastPipeline(ctx.obj["config"])
-        if ctx.obj["debug"]:
-            pipeline.config.debug = True
+        pipeline = _create_pipeline(ctx)
 
-        result = pipeline.run_full_pipeline(limit, interactive=interactive)
+        result = pipeline.run_full_pipeline(
+            limit, interactive=interactive, force_rescrape=force_rescrape
+        )
 
         if result["success"]:
             console.print("[bold green]Pipeline completed successfully![/bold green]")
@@ -838,7 +1081,7 @@ def fetch(ctx, limit):
 
     pipeline = None
     try:
-        pipeline = HackerCastPipeline(ctx.obj["config"])
+        pipeline = _create_pipeline(ctx)
         stories = pipeline.fetch_top_stories(limit)
         console.print(f"[green]Fetched {len(stories)} stories[/green]")
     finally:
@@ -853,7 +1096,7 @@ def scrape(ctx, url):
     """Scrape content from a single URL."""
     pipeline = None
     try:
-        pipeline = HackerCastPipeline(ctx.obj["config"])
+        pipeline = _create_pipeline(ctx)
         content = pipeline.scraper.scrape_article(url)
         if content:
             console.print(
@@ -875,7 +1118,7 @@ def tts(ctx, text, output_file, topic):
     """Convert text to speech."""
     pipeline = None
     try:
-        pipeline = HackerCastPipeline(ctx.obj["config"])
+        pipeline = _create_pipeline(ctx)
         pipeline._initialize_tts()
         success = pipeline.tts_converter.convert_text_to_speech(text, output_file, topic=topic)
         if success:
@@ -899,9 +1142,7 @@ def interactive(ctx, limit):
 
     pipeline = None
     try:
-        pipeline = HackerCastPipeline(ctx.obj["config"])
-        if ctx.obj["debug"]:
-            pipeline.config.debug = True
+        pipeline = _create_pipeline(ctx)
 
         result = pipeline.run_full_pipeline(limit, interactive=True)
 
@@ -937,20 +1178,18 @@ def publish(ctx, audio_file, title, summary, show_id, episode_number, season, pu
 
     pipeline = None
     try:
-        pipeline = HackerCastPipeline(ctx.obj["config"])
+        pipeline = _create_pipeline(ctx)
         pipeline._initialize_publisher()
 
         # Use provided values or generate defaults
+        episode_date = datetime.now().strftime('%B %d, %Y')
         if not title:
-            title = f"HackerCast Episode - {datetime.now().strftime('%B %d, %Y')}"
+            title = f"HackerCast Episode - {episode_date}"
 
         if not summary:
-            summary = f"HackerCast episode for {datetime.now().strftime('%B %d, %Y')}"
+            summary = f"HackerCast episode for {episode_date}"
 
-        # Get publisher config
-        publisher_config = PodcastPublisherConfig(
-            pipeline.config.podcast_publishing.__dict__ if hasattr(pipeline.config, 'podcast_publishing') else {}
-        )
+        publisher_config = pipeline.publisher_config
 
         # Use provided show_id or default
         target_show_id = show_id or publisher_config.default_show_id
@@ -997,7 +1236,7 @@ def shows(ctx):
     """List available podcast shows."""
     pipeline = None
     try:
-        pipeline = HackerCastPipeline(ctx.obj["config"])
+        pipeline = _create_pipeline(ctx)
         pipeline._initialize_publisher()
 
         shows = pipeline.podcast_publisher.get_shows()
@@ -1032,9 +1271,7 @@ def select(ctx, limit):
 
     pipeline = None
     try:
-        pipeline = HackerCastPipeline(ctx.obj["config"])
-        if ctx.obj["debug"]:
-            pipeline.config.debug = True
+        pipeline = _create_pipeline(ctx)
 
         # Fetch stories
         stories = pipeline.fetch_top_stories(limit)
@@ -1055,16 +1292,16 @@ def select(ctx, limit):
                 # Run the rest of the pipeline
                 scraped_content = pipeline.scrape_articles(selected_stories)
                 if scraped_content:
-                    script_content = pipeline.create_script(scraped_content)
-                    if script_content:
-                        audio_file = pipeline.convert_to_audio(script_content)
+                    segments = pipeline.prepare_podcast_segments(scraped_content)
+                    if segments:
+                        audio_file = pipeline.convert_to_audio(segments)
                         if audio_file:
                             console.print(f"[bold green]Pipeline completed! Audio saved to: {audio_file}[/bold green]")
                         else:
                             console.print("[red]Failed to generate audio[/red]")
                             sys.exit(1)
                     else:
-                        console.print("[red]Failed to create script[/red]")
+                        console.print("[red]Failed to prepare podcast segments[/red]")
                         sys.exit(1)
                 else:
                     console.print("[red]Failed to scrape articles[/red]")
@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 
+import gzip
+import hashlib
+import json
 import logging
+import os
 import re
 import sys
+import threading
 import time
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass
@@ -14,12 +20,53 @@ from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from goose3 import Goose
 
+try:
+    from resiliparse.extract.html2text import extract_plain_text
+    from resiliparse.parse.html import HTMLTree
+except ImportError:  # resiliparse is an optional, faster extractor
+    HTMLTree = None
+
 from config import get_config
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+class HostRateLimiter:
+    """Thread-safe limiter that spaces out requests to the same host."""
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_second: Maximum request rate per host (0 disables limiting)
+        """
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        """
+        Block until a request to the URL's host is allowed.
+
+        Args:
+            url: URL about to be requested
+        """
+        if not self.interval:
+            return
+
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            # Reserve the host's next free slot so concurrent callers queue up
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
 @dataclass
 class ScrapedContent:
     """Represents scraped content from a web page."""
@@ -34,8 +81,9 @@ class ScrapedContent:
     scraping_method: str = "unknown"
 
     def __post_init__(self):
-        """Calculate word count after initialization."""
-        if self.content:
+        """Calculate word count after initialization unless already known."""
+        # Cached entries carry their stored count, so skip re-splitting the body
+        if self.content and not self.word_count:
             self.word_count = len(self.content.split())
 
     def to_dict(self) -> Dict[str, Any]:
@@ -55,8 +103,13 @@ class ScrapedContent:
 class ArticleScraper:
     """Enhanced web scraper with multiple extraction strategies and fallbacks."""
 
-    def __init__(self):
-        """Initialize the scraper with configuration."""
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the scraper with configuration.
+
+        Args:
+            cache_dir: Directory for cached scrape results (caching disabled if None)
+        """
         self.config = get_config()
 
         # Configure session with retry strategy
@@ -66,7 +119,11 @@ class ArticleScraper:
             backoff_factor=self.config.scraping.retry_delay,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the per-host connection pool to match the scraping concurrency
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=self.config.scraping.max_concurrent_requests,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -81,11 +138,46 @@ class ArticleScraper:
             }
         )
 
-        # Initialize Goose for content extraction
-        self.goose = Goose()
+        # Copy per-request settings onto the instance so the fetch path reads
+        # plain attributes rather than walking the config object each time
+        self.timeout = self.config.scraping.timeout
+        self.max_content_length = self.config.scraping.max_content_length
+        self.allowed_content_types = tuple(self.config.scraping.allowed_content_types)
+
+        # Concurrent scrapes stay polite to any one host
+        self.rate_limiter = HostRateLimiter(
+            self.config.scraping.requests_per_host_per_second
+        )
+
+        # Scraped articles are reused across runs for cache_ttl_hours
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = self.config.scraping.cache_ttl_hours * 3600
+
+        # Goose instances for content extraction, one per thread: Goose's
+        # fetcher remembers the last fetched URL, so sharing one across
+        # concurrent scrapes would mix up results
+        self._local = threading.local()
+        self._gooses: List[Goose] = []
+        self._gooses_lock = threading.Lock()
 
         logger.info("Initialized article scraper")
 
+    @property
+    def goose(self) -> Goose:
+        """Get the Goose extractor for the calling thread, creating it on first use."""
+        goose = getattr(self._local, "goose", None)
+        if goose is None:
+            goose = Goose()
+            self.goose = goose
+        return goose
+
+    @goose.setter
+    def goose(self, goose: Goose) -> None:
+        """Set the Goose extractor for the calling thread."""
+        self._local.goose = goose
+        with self._gooses_lock:
+            self._gooses.append(goose)
+
     def _validate_url(self, url: str) -> bool:
         """
         Validate URL format.
@@ -115,26 +207,22 @@ class ArticleScraper:
         try:
             logger.debug(f"Fetching page: {url}")
 
-            response = self.session.get(
-                url, timeout=self.config.scraping.timeout, stream=True
-            )
+            self.rate_limiter.wait(url)
+            response = self.session.get(url, timeout=self.timeout, stream=True)
             response.raise_for_status()
 
             # Check content type
             content_type = response.headers.get("content-type", "").lower()
             if not any(
                 allowed_type in content_type
-                for allowed_type in self.config.scraping.allowed_content_types
+                for allowed_type in self.allowed_content_types
             ):
                 logger.warning(f"Unsupported content type: {content_type}")
                 return None
 
             # Check content length
             content_length = response.headers.get("content-length")
-            if (
-                content_length
-                and int(content_length) > self.config.scraping.max_content_length
-            ):
+            if content_length and int(content_length) > self.max_content_length:
                 logger.warning(f"Content too large: {content_length} bytes")
                 return None
 
@@ -154,19 +242,27 @@ class ArticleScraper:
             logger.error(f"Unexpected error fetching {url}: {e}")
             return None
 
-    def _extract_with_goose(self, url: str) -> Optional[ScrapedContent]:
+    def _extract_with_goose(
+        self, url: str, raw_html: Optional[str] = None
+    ) -> Optional[ScrapedContent]:
         """
         Extract content using Goose3 library.
 
         Args:
             url: URL to scrape
+            raw_html: Page HTML already fetched for this URL; Goose downloads
+                the page itself when omitted
 
         Returns:
             ScrapedContent or None if failed
         """
         try:
             logger.debug(f"Extracting content with Goose: {url}")
-            article = self.goose.extract(url)
+            if raw_html is None:
+                self.rate_limiter.wait(url)
+                article = self.goose.extract(url=url)
+            else:
+                article = self.goose.extract(url=url, raw_html=raw_html)
 
             if not article.cleaned_text:
                 logger.warning(f"Goose extracted no content from: {url}")
@@ -191,6 +287,50 @@ class ArticleScraper:
             logger.error(f"Goose extraction failed for {url}: {e}")
             return None
 
+    def _extract_with_resiliparse(
+        self, url: str, response: requests.Response
+    ) -> Optional[ScrapedContent]:
+        """
+        Extract content using Resiliparse's main-content extractor.
+
+        Args:
+            url: URL being scraped
+            response: HTTP response object
+
+        Returns:
+            ScrapedContent or None if failed
+        """
+        try:
+            logger.debug(f"Extracting content with Resiliparse: {url}")
+            tree = HTMLTree.parse(response.text)
+
+            text = extract_plain_text(tree, main_content=True)
+            if not text.strip():
+                logger.warning(f"Resiliparse extracted no content from: {url}")
+                return None
+
+            def meta_content(name: str) -> Optional[str]:
+                if tree.head is None:
+                    return None
+                tag = tree.head.query_selector(f'meta[name="{name}"]')
+                return tag.getattr("content") if tag else None
+
+            content = ScrapedContent(
+                url=url,
+                title=tree.title.strip() or "No Title",
+                content=text,
+                author=meta_content("author"),
+                meta_description=meta_content("description"),
+                scraping_method="resiliparse",
+            )
+
+            logger.debug(f"Resiliparse extracted {content.word_count} words")
+            return content
+
+        except Exception as e:
+            logger.error(f"Resiliparse extraction failed for {url}: {e}")
+            return None
+
     def _extract_with_beautifulsoup(
         self, url: str, response: requests.Response
     ) -> Optional[ScrapedContent]:
@@ -285,12 +425,15 @@ class ArticleScraper:
             logger.error(f"BeautifulSoup extraction failed for {url}: {e}")
             return None
 
-    def scrape_article(self, url: str) -> Optional[ScrapedContent]:
+    def scrape_article(
+        self, url: str, force_refresh: bool = False
+    ) -> Optional[ScrapedContent]:
         """
         Scrape article content from a URL using multiple strategies.
 
         Args:
             url: URL to scrape
+            force_refresh: Ignore any cached copy and fetch the article again
 
         Returns:
             ScrapedContent or None if failed
@@ -299,16 +442,57 @@ class ArticleScraper:
             logger.error(f"Invalid URL: {url}")
             return None
 
+        content = None if force_refresh else self._load_cached(url)
+        if content:
+            logger.info(f"Using cached article: {url}")
+            return content
+
+        content = self._scrape_uncached(url)
+        if content:
+            self._store_cached(content)
+        return content
+
+    def _scrape_uncached(self, url: str) -> Optional[ScrapedContent]:
+        """
+        Scrape a validated URL, trying each extraction strategy in turn.
+
+        Args:
+            url: URL to scrape
+
+        Returns:
+            ScrapedContent or None if failed
+        """
         logger.info(f"Scraping article: {url}")
 
-        # Strategy 1: Try Goose3 first (most sophisticated)
-        content = self._extract_with_goose(url)
+        # Strategy 1: Resiliparse, when installed (fastest main-content extraction).
+        # The page is fetched once here and reused by the later strategies.
+        response = None
+        if HTMLTree is not None:
+            response = self._fetch_page(url)
+            if response is None:
+                # _fetch_page already retried; the other strategies need the same page
+                logger.error(f"Failed to scrape content from: {url}")
+                return None
+
+            content = self._extract_with_resiliparse(url, response)
+            if content and content.word_count > 50:  # Minimum viable content
+                logger.info(
+                    f"Successfully scraped with Resiliparse: {content.word_count} words"
+                )
+                return content
+
+        # Strategy 2: Try Goose3 (most sophisticated), on the fetched page if any
+        if response is None:
+            content = self._extract_with_goose(url)
+        else:
+            content = self._extract_with_goose(url, raw_html=response.text)
         if content and content.word_count > 50:  # Minimum viable content
             logger.info(f"Successfully scraped with Goose: {content.word_count} words")
             return content
 
-        # Strategy 2: Fallback to BeautifulSoup
-        response = self._fetch_page(url)
+        # Strategy 3: Fallback to BeautifulSoup, reusing any page already fetched
+        if response is None:
+            response = self._fetch_page(url)
         if response:
             content = self._extract_with_beautifulsoup(url, response)
             if content and content.word_count > 50:
@@ -320,6 +504,57 @@ class ArticleScraper:
         logger.error(f"Failed to scrape content from: {url}")
         return None
 
+    def _cache_path(self, url: str) -> Path:
+        """Get the cache file path for a URL."""
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json.gz"
+
+    def _load_cached(self, url: str) -> Optional[ScrapedContent]:
+        """
+        Load a cached scrape result that is still within the TTL.
+
+        Args:
+            url: URL that was scraped
+
+        Returns:
+            Cached ScrapedContent or None on a miss
+        """
+        if not self.cache_dir or not self.cache_ttl:
+            return None
+
+        cache_path = self._cache_path(url)
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+            with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+                return ScrapedContent(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    def _store_cached(self, content: ScrapedContent) -> None:
+        """
+        Write a scrape result to the cache.
+
+        Args:
+            content: Successfully scraped content
+        """
+        if not self.cache_dir or not self.cache_ttl:
+            return
+
+        cache_path = self._cache_path(content.url)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(content.to_dict(), f)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache article {content.url}: {e}")
+
     def scrape_multiple_articles(self, urls: List[str]) -> List[ScrapedContent]:
         """
         Scrape multiple articles with progress logging.
@@ -360,7 +595,11 @@ class ArticleScraper:
 
     def cleanup(self):
         """Clean up resources."""
-        self.goose.close()
+        with self._gooses_lock:
+            gooses, self._gooses = self._gooses, []
+        for goose in gooses:
+            goose.close()
+        self._local = threading.local()
         self.session.close()
 
 
@@ -14,6 +14,14 @@ class SelectableStory:
     story: HackerNewsStory
     selected: bool = True  # Selected by default (opt-out design)
     preview_text: Optional[str] = None
+    # Lowercased title and author, computed once for text filtering
+    _title_lower: str = field(init=False, repr=False, compare=False)
+    _by_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the lowercased fields used by text filters."""
+        self._title_lower = self.story.title.lower()
+        self._by_lower = self.story.by.lower()
 
     @property
     def display_title(self) -> str:
@@ -30,7 +38,18 @@ class SelectableStory:
     @property
     def age_hours(self) -> int:
         """Get story age in hours."""
-        now = datetime.now().timestamp()
+        return self.age_hours_at(datetime.now().timestamp())
+
+    def age_hours_at(self, now: float) -> int:
+        """
+        Get story age in hours relative to a given timestamp.
+
+        Args:
+            now: Reference Unix timestamp, shared across a batch of stories
+
+        Returns:
+            Whole hours between the story's creation and now
+        """
         return int((now - self.story.time) / 3600)
 
     def toggle_selection(self) -> None:
@@ -45,6 +64,14 @@ class StorySelection:
     stories: List[SelectableStory] = field(default_factory=list)
     _filter_query: str = ""
     _show_only_with_urls: bool = False
+    # Last filter result and the inputs it was computed from; only one is
+    # kept so an interactive session's many queries don't accumulate copies
+    _filtered_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _filtered_result: List[SelectableStory] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize after creation."""
@@ -78,6 +105,12 @@ class StorySelection:
     @property
     def filtered_stories(self) -> List[SelectableStory]:
         """Get stories matching current filters."""
+        # Filters only look at title, author and URL, so selection changes
+        # never invalidate the cached result
+        cache_key = (self._filter_query, self._show_only_with_urls, len(self.stories))
+        if cache_key == self._filtered_key:
+            return self._filtered_result
+
         filtered = self.stories
 
         # Apply URL filter
@@ -89,10 +122,12 @@ class StorySelection:
             query_lower = self._filter_query.lower()
             filtered = [
                 story for story in filtered
-                if query_lower in story.story.title.lower() or
-                   query_lower in story.story.by.lower()
+                if query_lower in story._title_lower or
+                   query_lower in story._by_lower
             ]
 
+        self._filtered_key = cache_key
+        self._filtered_result = filtered
         return filtered
 
     @property
@@ -147,13 +182,14 @@ class StorySelection:
                           has_url_only: bool = False) -> int:
         """Select stories by criteria. Returns number of stories selected."""
         count = 0
+        now = datetime.now().timestamp()
         for story in self.stories:
             should_select = True
 
             if min_score is not None and story.story.score < min_score:
                 should_select = False
 
-            if max_age_hours is not None and story.age_hours > max_age_hours:
+            if max_age_hours is not None and story.age_hours_at(now) > max_age_hours:
                 should_select = False
 
             if has_url_only and not story.has_url:
@@ -184,12 +220,23 @@ class StorySelection:
 
     def get_selection_summary(self) -> Dict[str, int]:
         """Get summary of current selection state."""
+        # Count everything in one pass over the stories
+        selected = with_urls = selected_with_urls = 0
+        for story in self.stories:
+            has_url = story.has_url
+            if has_url:
+                with_urls += 1
+            if story.selected:
+                selected += 1
+                if has_url:
+                    selected_with_urls += 1
+
         return {
             "total": self.total_count,
-            "selected": self.selected_count,
+            "selected": selected,
             "filtered": len(self.filtered_stories),
-            "with_urls": sum(1 for s in self.stories if s.has_url),
-            "selected_with_urls": sum(1 for s in self.stories if s.selected and s.has_url)
+            "with_urls": with_urls,
+            "selected_with_urls": selected_with_urls
         }
 
     def validate_selection(self) -> Dict[str, List[str]]:
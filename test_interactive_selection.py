@@ -10,7 +10,7 @@ from datetime import datetime
 
 from hn_api import HackerNewsStory
 from story_selection import SelectableStory, StorySelection
-from interactive_selector import InteractiveStorySelector
+from interactive_selector import InteractiveStorySelector, _format_age, _format_story_row
 
 
 class TestSelectableStory:
@@ -152,6 +152,38 @@ class TestStorySelection:
         assert len(filtered) == 1
         assert "Story 1" in filtered[0].story.title
 
+    def test_selection_summary(self):
+        """Test the selection summary counts."""
+        selection = StorySelection.from_hn_stories(self.create_test_stories(5))
+        selection.stories[0].selected = False  # Has URL
+        selection.stories[1].selected = False  # No URL
+
+        assert selection.get_selection_summary() == {
+            "total": 5,
+            "selected": 3,
+            "filtered": 5,
+            "with_urls": 3,
+            "selected_with_urls": 2,
+        }
+
+    def test_filtered_stories_cached_until_filters_change(self):
+        """Test that the filtered list is reused until a filter changes."""
+        hn_stories = self.create_test_stories(5)
+        selection = StorySelection.from_hn_stories(hn_stories)
+        selection.set_url_filter(True)
+
+        first = selection.filtered_stories
+        selection.stories[0].toggle_selection()
+        assert selection.filtered_stories is first
+
+        selection.set_filter("STORY 1")
+        assert len(selection.filtered_stories) == 1
+
+        # Only the latest result is kept, so an earlier filter is recomputed
+        selection.set_filter("")
+        assert selection.filtered_stories == first
+        assert selection.filtered_stories is not first
+
     def test_bulk_operations(self):
         """Test bulk selection operations."""
         hn_stories = self.create_test_stories(5)
@@ -275,6 +307,191 @@ class TestInteractiveSelector:
         assert selector.selection is not None
         assert selector.selection.total_count == 3
 
+    @patch('interactive_selector.Prompt.ask')
+    def test_command_dispatch(self, mock_prompt):
+        """Test that command aliases reach their handlers."""
+        from rich.console import Console
+
+        mock_prompt.side_effect = ["i", "next", "bogus", "q"]
+
+        selector = InteractiveStorySelector(Console(record=True))
+        result = selector.select_stories(self.create_test_stories(3))
+
+        assert result == []
+        assert selector.selection.selected_count == 0
+
+    @patch('interactive_selector.Prompt.ask')
+    def test_parameterized_commands(self, mock_prompt):
+        """Test score:N and hours:N parsing, including malformed values."""
+        from rich.console import Console
+
+        mock_prompt.side_effect = ["n", "score:110", "score:x", "q"]
+
+        console = Console(record=True, width=120)
+        selector = InteractiveStorySelector(console)
+        selector.select_stories(self.create_test_stories(3))
+
+        assert [s.selected for s in selector.selection.stories] == [False, True, True]
+        assert "Invalid score format" in console.export_text()
+
+    def test_display_interface_renders_single_frame(self):
+        """Test that a redraw is emitted as one console print."""
+        from rich.console import Console
+
+        console = Console(record=True, width=120)
+        selector = InteractiveStorySelector(console)
+        selector.selection = StorySelection.from_hn_stories(self.create_test_stories(3))
+
+        with patch.object(console, "print", wraps=console.print) as mock_print:
+            selector._display_interface()
+
+        assert mock_print.call_count == 1
+        assert selector._frame_buffer == []
+        output = console.export_text()
+        assert "Interactive Test Story 1" in output
+        assert "Quick Commands" in output
+
+    def test_display_interface_repaints_terminal_in_place(self):
+        """Test that terminal redraws go home and erase lines instead of clearing."""
+        import io
+        from rich.console import Console
+
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=True, width=120, height=50)
+        selector = InteractiveStorySelector(console)
+        selector.selection = StorySelection.from_hn_stories(self.create_test_stories(3))
+
+        selector._display_interface()
+
+        rendered = output.getvalue()
+        assert rendered.startswith("\x1b[H")
+        assert "\x1b[2J" not in rendered
+        assert "Interactive Test Story 1" in rendered
+
+    def test_tall_frame_written_once(self):
+        """Test that a frame taller than the screen is cleared and drawn in one write."""
+        import io
+        from rich.console import Console
+
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=True, width=120, height=5)
+        selector = InteractiveStorySelector(console)
+        selector.selection = StorySelection.from_hn_stories(self.create_test_stories(3))
+
+        with patch.object(output, "write", wraps=output.write) as mock_write:
+            selector._display_interface()
+
+        assert mock_write.call_count == 1
+        assert output.getvalue().startswith("\x1b[2J")
+
+    def test_display_interface_skips_unchanged_frame(self):
+        """Test that redraws are skipped until the visible state changes."""
+        from rich.console import Console
+
+        console = Console(record=True, width=120)
+        selector = InteractiveStorySelector(console)
+        selector.selection = StorySelection.from_hn_stories(self.create_test_stories(3))
+
+        with patch.object(console, "clear") as mock_clear:
+            selector._display_interface()
+            selector._display_interface()
+            assert mock_clear.call_count == 1
+
+            selector._toggle_current_story()
+            selector._display_interface()
+            assert mock_clear.call_count == 2
+
+    def test_repeated_status_not_left_pending(self):
+        """Test that a status repeated on an unchanged frame is not shown again later."""
+        from rich.console import Console
+
+        console = Console(record=True, width=120)
+        selector = InteractiveStorySelector(console)
+        selector.selection = StorySelection.from_hn_stories(self.create_test_stories(3))
+
+        selector._set_status("Unknown command: x", "red")
+        selector._display_interface()
+        selector._set_status("Unknown command: x", "red")
+        selector._display_interface()
+        assert selector._status_msg is None
+
+        # A forced redraw (as after help or preview) shows no stale footer
+        console.export_text()
+        selector._last_frame_state = None
+        selector._display_interface()
+        assert "Unknown command" not in console.export_text()
+
+    def test_status_message_rendered_with_frame(self):
+        """Test that command feedback is drawn once as part of the next frame."""
+        from rich.console import Console
+
+        console = Console(record=True, width=120)
+        selector = InteractiveStorySelector(console)
+        selector.selection = StorySelection.from_hn_stories(self.create_test_stories(3))
+
+        selector._next_page()
+        assert console.export_text() == ""
+
+        selector._display_interface()
+        assert "Already on last page" in console.export_text()
+        assert selector._status_msg is None
+
+    @patch('interactive_selector.Prompt.ask')
+    def test_prompt_never_shown_under_stale_frame(self, mock_prompt):
+        """Test that quick commands are drawn, with their status, before the next prompt."""
+        from rich.console import Console
+
+        console = Console(record=True, width=120)
+        selector = InteractiveStorySelector(console)
+        frames_at_prompt = []
+
+        def answer(*args, **kwargs):
+            frames_at_prompt.append(console.export_text())
+            return answers.pop(0)
+
+        answers = ["n", "score:x", "q"]
+        mock_prompt.side_effect = answer
+
+        selector.select_stories(self.create_test_stories(3))
+
+        assert "Selected: 0" in frames_at_prompt[1]
+        assert "Deselected 3 stories" in frames_at_prompt[1]
+        assert "Invalid score format" in frames_at_prompt[2]
+
+
+class TestRowFormatting:
+    """Test story table row formatting helpers."""
+
+    def test_format_age(self):
+        """Test hour and day age formatting."""
+        assert _format_age(5) == "5h"
+        assert _format_age(50) == "2d"
+
+    def test_age_hours_at(self):
+        """Test age computed against a shared reference time."""
+        story = SelectableStory(story=HackerNewsStory(
+            id=1, title="Aged", url=None, score=1, by="u", time=1_000_000, descendants=0
+        ))
+
+        assert story.age_hours_at(1_000_000 + 3 * 3600 + 59) == 3
+
+    def test_format_story_row(self):
+        """Test row cells for the current, selected story."""
+        story = SelectableStory(story=HackerNewsStory(
+            id=1,
+            title="Row Story",
+            url=None,
+            score=42,
+            by="a_very_long_username",
+            time=int(datetime.now().timestamp()),
+            descendants=0
+        ))
+
+        row = _format_story_row(story, 4, True, story.story.time + 60)
+
+        assert row == ("5", "[green]✓[/green]", "[reverse]Row Story[/reverse]",
+                       "42", "0h", "a_very_long_us", "❌")
+
 
 def run_basic_tests():
     """Run basic functionality tests without pytest."""
@@ -28,6 +28,7 @@ class TestAppConfig:
 
         assert config.environment == "development"
         assert config.debug is False
+        assert config.quiet is False
         assert isinstance(config.hackernews, HackerNewsConfig)
         assert isinstance(config.scraping, ScrapingConfig)
         assert isinstance(config.tts, TTSConfig)
@@ -47,6 +48,7 @@ class TestHackerNewsConfig:
         assert config.timeout == 30
         assert config.retry_attempts == 3
         assert config.retry_delay == 1.0
+        assert config.max_concurrent_requests == 10
 
 
 class TestScrapingConfig:
@@ -61,6 +63,9 @@ class TestScrapingConfig:
         assert config.retry_attempts == 3
         assert config.max_content_length == 1048576
         assert "text/html" in config.allowed_content_types
+        assert config.max_concurrent_requests == 8
+        assert config.cache_ttl_hours == 24
+        assert config.requests_per_host_per_second == 5.0
 
 
 class TestTTSConfig:
@@ -76,6 +81,8 @@ class TestTTSConfig:
         assert config.pitch == 0.0
         assert config.max_text_length == 5000
         assert config.audio_format == "MP3"
+        assert config.max_concurrent_requests == 8
+        assert config.cache_ttl_hours == 72
 
 
 class TestLoggingConfig:
@@ -103,6 +110,7 @@ class TestOutputConfig:
         assert config.audio_dir == "audio"
         assert config.data_dir == "data"
         assert config.logs_dir == "logs"
+        assert config.cache_dir == "cache"
         assert config.date_format == "%Y-%m-%d"
 
 
@@ -120,8 +128,11 @@ class TestConfigManager:
                 assert config_manager.config.environment == "test"
                 assert isinstance(config_manager.config, AppConfig)
 
-                # Check that directories were created
+                # Directories are only created once a path is requested
                 output_path = Path(temp_dir)
+                assert not (output_path / "audio").exists()
+
+                config_manager.get_output_path("audio", "test.mp3")
                 assert (output_path / "audio").exists()
                 assert (output_path / "data").exists()
                 assert (output_path / "logs").exists()
@@ -133,6 +144,7 @@ class TestConfigManager:
             {
                 "HACKERCAST_ENV": "production",
                 "HACKERCAST_DEBUG": "true",
+                "HACKERCAST_QUIET": "1",
                 "HN_MAX_STORIES": "10",
                 "HN_TIMEOUT": "60",
                 "SCRAPING_USER_AGENT": "TestAgent/1.0",
@@ -148,6 +160,7 @@ class TestConfigManager:
 
             assert config.environment == "production"
             assert config.debug is True
+            assert config.quiet is True
             assert config.hackernews.max_stories == 10
             assert config.hackernews.timeout == 60
             assert config.scraping.user_agent == "TestAgent/1.0"
@@ -157,6 +170,42 @@ class TestConfigManager:
             assert config.logging.level == "DEBUG"
             assert config.output.base_dir == "/tmp/test"
 
+    def test_load_boolean_flags_and_empty_values(self):
+        """Test boolean flag parsing and that empty values keep defaults."""
+        with patch.dict(
+            "os.environ",
+            {
+                "PODCAST_PUBLISHING_ENABLED": "YES",
+                "PODCAST_AUTO_PUBLISH": "0",
+                "HN_MAX_STORIES": "",
+            },
+        ):
+            config = ConfigManager().config
+
+            assert config.podcast_publishing.enabled is True
+            assert config.podcast_publishing.auto_publish is False
+            assert config.hackernews.max_stories == 20
+
+    def test_dotenv_parsed_once(self):
+        """Test that the .env file is parsed once and never overrides the environment."""
+        import config
+
+        config._read_dotenv.cache_clear()
+        try:
+            with patch(
+                "config.dotenv_values",
+                return_value={"HN_MAX_STORIES": "7", "HN_TIMEOUT": "45"},
+            ) as mock_values, patch.dict("os.environ", {"HN_TIMEOUT": "15"}):
+                first = ConfigManager().config
+                second = ConfigManager().config
+
+                assert mock_values.call_count == 1
+                assert first.hackernews.max_stories == 7
+                assert second.hackernews.max_stories == 7
+                assert first.hackernews.timeout == 15
+        finally:
+            config._read_dotenv.cache_clear()
+
     def test_validate_config_success(self):
         """Test configuration validation with valid values."""
         with patch.dict(
@@ -211,6 +260,35 @@ class TestConfigManager:
                 assert data_path == Path(temp_dir) / "data" / "test.json"
                 assert logs_path == Path(temp_dir) / "logs" / "test.log"
 
+    def test_get_dated_output_path_archives_latest(self):
+        """Test dated paths are created and an existing latest file is archived."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict("os.environ", {"OUTPUT_BASE_DIR": temp_dir}):
+                config_manager = ConfigManager()
+
+                latest = config_manager.get_dated_output_path("data", "json", "20250101")
+                assert latest == Path(temp_dir) / "data" / "20250101" / "latest.json"
+                assert latest.parent.is_dir()
+
+                latest.write_text("{}")
+                again = config_manager.get_dated_output_path("data", "json", "20250101")
+
+                assert again == latest
+                assert not latest.exists()
+                assert len(list(latest.parent.glob("*.json"))) == 1
+
+    def test_output_dirs_recreated_by_new_manager(self):
+        """Test directory memoization is per manager, so deleted dirs come back."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict("os.environ", {"OUTPUT_BASE_DIR": temp_dir}):
+                audio_dir = Path(temp_dir) / "audio"
+
+                ConfigManager().get_output_path("audio", "test.mp3")
+                audio_dir.rmdir()
+
+                ConfigManager().get_output_path("audio", "test.mp3")
+                assert audio_dir.is_dir()
+
     def test_get_output_path_invalid_type(self):
         """Test getting output path with invalid file type."""
         config_manager = ConfigManager()
@@ -5,7 +5,12 @@ import pytest
 from unittest.mock import Mock, patch
 import requests
 
-from hn_api import HackerNewsAPI, HackerNewsStory, get_top_story_ids
+from hn_api import (
+    HackerNewsAPI,
+    HackerNewsStory,
+    _truncate_json_array,
+    get_top_story_ids,
+)
 
 
 class TestHackerNewsStory:
@@ -33,6 +38,15 @@ class TestHackerNewsStory:
         assert created_at.month == 1
         assert created_at.day == 19
 
+    def test_story_is_immutable(self, mock_hn_story_data):
+        """Test that stories are frozen and hashable."""
+        story = HackerNewsStory(**mock_hn_story_data)
+
+        with pytest.raises(AttributeError):
+            story.score = 1
+        assert story == HackerNewsStory(**mock_hn_story_data)
+        assert hash(story) == hash(HackerNewsStory(**mock_hn_story_data))
+
     def test_story_to_dict(self, mock_hn_story_data):
         """Test converting story to dictionary."""
         story = HackerNewsStory(**mock_hn_story_data)
@@ -41,7 +55,7 @@ class TestHackerNewsStory:
         assert story_dict["id"] == 12345
         assert story_dict["title"] == "Test Story Title"
         assert story_dict["url"] == "https://example.com/test-article"
-        assert "created_at" in story_dict
+        assert story_dict["created_at"] == story.created_at.isoformat()
 
 
 class TestHackerNewsAPI:
@@ -55,12 +69,29 @@ class TestHackerNewsAPI:
             assert api.base_url == "https://hacker-news.firebaseio.com/v0"
             assert api.timeout == test_config.hackernews.timeout
 
+    def test_api_instances_share_session(self, test_config):
+        """Test that API clients reuse one pooled session."""
+        with patch("hn_api.get_config", return_value=test_config):
+            assert HackerNewsAPI().session is HackerNewsAPI().session
+
+    def test_session_follows_concurrency_setting(self, test_config):
+        """Test that a different pool size gets its own, wider session."""
+        with patch("hn_api.get_config", return_value=test_config):
+            default_session = HackerNewsAPI().session
+
+            test_config.hackernews.max_concurrent_requests += 10
+            wider_session = HackerNewsAPI().session
+
+        assert wider_session is not default_session
+        adapter = wider_session.get_adapter("https://hacker-news.firebaseio.com")
+        assert adapter._pool_maxsize == test_config.hackernews.max_concurrent_requests
+
     @patch("hn_api.requests.Session.get")
     def test_make_request_success(self, mock_get, test_config):
         """Test successful API request."""
         # Setup mock response
         mock_response = Mock()
-        mock_response.json.return_value = {"test": "data"}
+        mock_response.content = json.dumps({"test": "data"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -71,6 +102,22 @@ class TestHackerNewsAPI:
             assert result == {"test": "data"}
             mock_get.assert_called_once()
 
+    @patch("hn_api.orjson", None)
+    @patch("hn_api.requests.Session.get")
+    def test_make_request_without_orjson(self, mock_get, test_config):
+        """Test that the stdlib fallback decodes through response.json()."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"test": "data"}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with patch("hn_api.get_config", return_value=test_config):
+            api = HackerNewsAPI()
+            result = api._make_request("test.json")
+
+            assert result == {"test": "data"}
+            mock_response.json.assert_called_once()
+
     @patch("hn_api.requests.Session.get")
     def test_make_request_timeout(self, mock_get, test_config):
         """Test API request timeout."""
@@ -97,16 +144,29 @@ class TestHackerNewsAPI:
 
             assert result is None
 
+    @patch("hn_api.requests.Session.get")
+    def test_make_request_invalid_json(self, mock_get, test_config):
+        """Test API request with a malformed JSON body."""
+        mock_response = Mock()
+        mock_response.content = b"{not json"
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with patch("hn_api.get_config", return_value=test_config):
+            api = HackerNewsAPI()
+            result = api._make_request("test.json")
+
+            assert result is None
+
     @patch("hn_api.requests.Session.get")
     def test_get_top_story_ids_success(
         self, mock_get, test_config, mock_hn_stories_list
     ):
         """Test getting top story IDs successfully."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_hn_stories_list + [
-            12350,
-            12351,
-        ]  # Extra stories
+        mock_response.content = json.dumps(
+            mock_hn_stories_list + [12350, 12351]  # Extra stories
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -129,7 +189,7 @@ class TestHackerNewsAPI:
     def test_get_story_details_success(self, mock_get, test_config, mock_hn_story_data):
         """Test getting story details successfully."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_hn_story_data
+        mock_response.content = json.dumps(mock_hn_story_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -147,7 +207,7 @@ class TestHackerNewsAPI:
         incomplete_data = {"id": 12345, "title": "Test"}  # Missing required fields
 
         mock_response = Mock()
-        mock_response.json.return_value = incomplete_data
+        mock_response.content = json.dumps(incomplete_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -157,10 +217,16 @@ class TestHackerNewsAPI:
 
             assert story is None
 
+    @patch("hn_api.HackerNewsAPI.get_stories_batch", return_value={})
     @patch("hn_api.HackerNewsAPI.get_story_details")
     @patch("hn_api.HackerNewsAPI.get_top_story_ids")
     def test_get_top_stories_success(
-        self, mock_get_ids, mock_get_details, test_config, mock_hn_story_data
+        self,
+        mock_get_ids,
+        mock_get_details,
+        mock_batch,
+        test_config,
+        mock_hn_story_data,
     ):
         """Test getting complete top stories."""
         mock_get_ids.return_value = [12345, 12346]
@@ -172,7 +238,9 @@ class TestHackerNewsAPI:
         story2_data["title"] = "Second Story"
         story2 = HackerNewsStory(**story2_data)
 
-        mock_get_details.side_effect = [story1, story2]
+        # Details are fetched concurrently, so key the mock by story ID
+        stories_by_id = {12345: story1, 12346: story2}
+        mock_get_details.side_effect = lambda story_id: stories_by_id[story_id]
 
         with patch("hn_api.get_config", return_value=test_config):
             api = HackerNewsAPI()
@@ -182,6 +250,112 @@ class TestHackerNewsAPI:
             assert stories[0].title == "Test Story Title"
             assert stories[1].title == "Second Story"
 
+    @patch("hn_api.HackerNewsAPI.get_stories_batch", return_value={})
+    @patch("hn_api.HackerNewsAPI.get_story_details")
+    @patch("hn_api.HackerNewsAPI.get_top_story_ids")
+    def test_get_top_stories_preserves_order_with_failures(
+        self,
+        mock_get_ids,
+        mock_get_details,
+        mock_batch,
+        test_config,
+        mock_hn_story_data,
+    ):
+        """Test that concurrent fetches keep ranking order and skip failures."""
+        mock_get_ids.return_value = [1, 2, 3, 4]
+
+        def fake_details(story_id):
+            if story_id == 2:
+                return None
+            data = mock_hn_story_data.copy()
+            data["id"] = story_id
+            return HackerNewsStory(**data)
+
+        mock_get_details.side_effect = fake_details
+
+        with patch("hn_api.get_config", return_value=test_config):
+            api = HackerNewsAPI()
+            stories = api.get_top_stories(4)
+
+            assert [story.id for story in stories] == [1, 3, 4]
+            assert mock_get_details.call_count == 4
+
+    @patch("hn_api.HackerNewsAPI.get_story_details")
+    @patch("hn_api.HackerNewsAPI.get_stories_batch")
+    @patch("hn_api.HackerNewsAPI.get_top_story_ids")
+    def test_get_top_stories_batch_with_fallback(
+        self,
+        mock_get_ids,
+        mock_batch,
+        mock_get_details,
+        test_config,
+        mock_hn_story_data,
+    ):
+        """Test that only stories missing from the batch are fetched individually."""
+        mock_get_ids.return_value = [1, 2, 3]
+
+        def make_story(story_id):
+            data = mock_hn_story_data.copy()
+            data["id"] = story_id
+            return HackerNewsStory(**data)
+
+        mock_batch.return_value = {1: make_story(1), 3: make_story(3)}
+        mock_get_details.side_effect = make_story
+
+        with patch("hn_api.get_config", return_value=test_config):
+            api = HackerNewsAPI()
+            stories = api.get_top_stories(3)
+
+            assert [story.id for story in stories] == [1, 2, 3]
+            mock_get_details.assert_called_once_with(2)
+
+    @patch("hn_api.requests.Session.get")
+    def test_get_stories_batch(self, mock_get, test_config):
+        """Test parsing story details from an Algolia search response."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {
+                "hits": [
+                    {
+                        "objectID": "12345",
+                        "title": "Algolia Story",
+                        "url": "https://example.com",
+                        "points": 150,
+                        "author": "testuser",
+                        "created_at_i": 1642608000,
+                        "num_comments": 42,
+                    },
+                    {
+                        "objectID": "12346",
+                        "title": "Ask HN: No URL",
+                        "url": "",
+                        "points": 10,
+                        "author": "asker",
+                        "created_at_i": 1642608000,
+                        "num_comments": None,
+                    },
+                    {"objectID": "12347"},  # Incomplete hit is skipped
+                ]
+            }
+        ).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with patch("hn_api.get_config", return_value=test_config):
+            api = HackerNewsAPI()
+            stories = api.get_stories_batch([12345, 12346, 12347])
+
+            assert set(stories) == {12345, 12346}
+            assert stories[12345].score == 150
+            assert stories[12345].by == "testuser"
+            assert stories[12345].descendants == 42
+            assert stories[12346].url is None
+            assert stories[12346].descendants == 0
+
+            params = mock_get.call_args.kwargs["params"]
+            assert params["tags"] == "story,(story_12345,story_12346,story_12347)"
+            assert params["hitsPerPage"] == 3
+
     @patch("hn_api.HackerNewsAPI.get_top_story_ids")
     def test_get_top_stories_no_ids(self, mock_get_ids, test_config):
         """Test getting top stories when no IDs are returned."""
@@ -194,6 +368,24 @@ class TestHackerNewsAPI:
             assert stories == []
 
 
+class TestTruncateJsonArray:
+    """Test early truncation of array responses."""
+
+    def test_truncates_long_array(self):
+        """Test that only the leading items are kept."""
+        assert _truncate_json_array(b"[1, 2, 3, 4, 5]", 2) == b"[1, 2]"
+
+    def test_short_array_unchanged(self):
+        """Test that arrays within the limit are returned as-is."""
+        assert _truncate_json_array(b"[1,2,3]", 3) == b"[1,2,3]"
+        assert _truncate_json_array(b"[]", 5) == b"[]"
+
+    def test_non_array_unchanged(self):
+        """Test that non-array bodies pass through untouched."""
+        body = b'{"a": 1, "b": 2}'
+        assert _truncate_json_array(body, 1) == body
+
+
 class TestLegacyFunctions:
     """Test legacy backward compatibility functions."""
 
@@ -3,10 +3,11 @@
 import json
 import pytest
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-from main import HackerCastPipeline
+from main import HackerCastPipeline, _create_pipeline, _ellipsize
 from hn_api import HackerNewsStory
 from scraper import ScrapedContent
 
@@ -19,7 +20,7 @@ class TestHackerCastPipelineIntegration:
         """Mock all external dependencies for integration tests."""
         with patch("main.HackerNewsAPI") as mock_hn_api, patch(
             "main.ArticleScraper"
-        ) as mock_scraper, patch("main.TTSConverter") as mock_tts:
+        ) as mock_scraper, patch("tts_converter.TTSConverter") as mock_tts:
 
             # Mock HN API
             mock_hn_instance = Mock()
@@ -328,7 +329,8 @@ class TestHackerCastPipelineIntegration:
             with patch("main.initialize_config") as mock_init_config:
                 mock_config_manager = Mock()
                 mock_config_manager.config = test_config
-                mock_config_manager.get_output_path.return_value = data_file_path
+                mock_config_manager.get_dated_output_path.return_value = data_file_path
+                mock_config_manager.get_log_config_dict.return_value = {"version": 1}
                 mock_init_config.return_value = mock_config_manager
 
                 pipeline = HackerCastPipeline()
@@ -360,6 +362,7 @@ class TestHackerCastPipelineIntegration:
 
                 assert result_path == data_file_path
                 assert data_file_path.exists()
+                assert list(Path(temp_dir).iterdir()) == [data_file_path]
 
                 # Verify the saved data
                 with open(data_file_path, "r") as f:
@@ -494,3 +497,161 @@ class TestHackerCastPipelineIntegration:
             pipeline.cleanup()
 
             mock_pipeline_components["scraper"].cleanup.assert_called_once()
+
+
+class TestStoryValidation:
+    """Test validation of selected stories."""
+
+    def test_validate_selected_stories(self, test_config):
+        """Test that invalid or foreign story objects are dropped."""
+        with patch("main.initialize_config") as mock_init_config:
+            mock_init_config.return_value.config = test_config
+            mock_init_config.return_value.get_log_config_dict.return_value = {
+                "version": 1
+            }
+            pipeline = HackerCastPipeline()
+
+        def story(**overrides):
+            fields = dict(
+                id=1,
+                title="Title",
+                url="https://example.com",
+                score=10,
+                by="user",
+                time=1642608000,
+                descendants=0,
+            )
+            fields.update(overrides)
+            return HackerNewsStory(**fields)
+
+        class BrokenStory:
+            """Story whose id property raises something other than AttributeError."""
+
+            title = "Broken"
+            score = 1
+
+            @property
+            def id(self):
+                raise ValueError("corrupt id")
+
+        good = story()
+        text_post = story(id=2, url=None)
+        odd_url = story(id=3, url="example.com")
+        stories = [
+            good,
+            text_post,
+            odd_url,
+            story(id=0),
+            story(title="  "),
+            story(score=-1),
+            object(),
+            BrokenStory(),
+        ]
+
+        assert pipeline._validate_selected_stories(stories) == [
+            good,
+            text_post,
+            odd_url,
+        ]
+
+    def test_select_stories_interactively_skips_foreign_objects(self, test_config):
+        """Test that objects lacking story fields never reach the selector."""
+        with patch("main.initialize_config") as mock_init_config:
+            mock_init_config.return_value.config = test_config
+            mock_init_config.return_value.get_log_config_dict.return_value = {
+                "version": 1
+            }
+            pipeline = HackerCastPipeline()
+
+        story = HackerNewsStory(
+            id=1,
+            title="Title",
+            url="https://example.com",
+            score=10,
+            by="user",
+            time=1642608000,
+            descendants=0,
+        )
+
+        with patch("main.InteractiveStorySelector") as mock_selector:
+            mock_selector.return_value.select_stories.side_effect = lambda s: s
+            selected = pipeline.select_stories_interactively([story, object()])
+
+        mock_selector.return_value.select_stories.assert_called_once_with([story])
+        assert selected == [story]
+
+
+class TestPublishIdempotency:
+    """Test that unchanged episodes are not uploaded twice."""
+
+    def test_skip_republish_unchanged_episode(self, test_config, tmp_path):
+        """Test a rerun with the same audio and metadata reuses the last result."""
+        test_config.output.base_dir = str(tmp_path)
+        with patch("main.initialize_config") as mock_init_config:
+            mock_init_config.return_value.config = test_config
+            mock_init_config.return_value.get_log_config_dict.return_value = {
+                "version": 1
+            }
+            pipeline = HackerCastPipeline()
+
+        pipeline.__dict__["publisher_config"] = Mock(
+            default_show_id="show-1", auto_publish=False
+        )
+        pipeline.podcast_publisher = Mock()
+        pipeline.podcast_publisher.publish_podcast_episode.return_value = {
+            "success": True,
+            "episode_id": "ep-1",
+            "episode_url": None,
+        }
+        pipeline.run_started = datetime(2025, 1, 20, 8, 0)
+
+        audio_file = tmp_path / "episode.mp3"
+        audio_file.write_bytes(b"audio")
+
+        first = pipeline.publish_to_podcast_host(audio_file, "", 3)
+        second = pipeline.publish_to_podcast_host(audio_file, "", 3)
+
+        assert first == second
+        assert pipeline.podcast_publisher.publish_podcast_episode.call_count == 1
+
+        # A rerun writes the same audio to a new file
+        rerun_file = tmp_path / "rerun" / "episode.mp3"
+        rerun_file.parent.mkdir()
+        rerun_file.write_bytes(b"audio")
+        assert pipeline.publish_to_podcast_host(rerun_file, "", 3) == first
+        assert pipeline.podcast_publisher.publish_podcast_episode.call_count == 1
+
+        # New audio means a new episode
+        audio_file.write_bytes(b"different audio")
+        pipeline.publish_to_podcast_host(audio_file, "", 3)
+        assert pipeline.podcast_publisher.publish_podcast_episode.call_count == 2
+
+
+class TestCreatePipeline:
+    """Test that global CLI flags reach every command's pipeline."""
+
+    def test_create_pipeline_applies_flags(self, test_config):
+        """Test --debug and --quiet are applied to the created pipeline."""
+        ctx = Mock(obj={"config": None, "debug": True, "quiet": True})
+        with patch("main.initialize_config") as mock_init_config:
+            mock_init_config.return_value.config = test_config
+            mock_init_config.return_value.get_log_config_dict.return_value = {
+                "version": 1
+            }
+            pipeline = _create_pipeline(ctx)
+
+        assert pipeline.config.debug is True
+        assert pipeline.config.quiet is True
+        assert pipeline._hide_progress() is True
+
+
+class TestEllipsize:
+    """Test the display truncation helper."""
+
+    def test_ellipsize(self):
+        """Test short, long and missing text."""
+        assert _ellipsize("short", 10) == "short"
+        assert _ellipsize("exactly10!", 10) == "exactly10!"
+        assert _ellipsize("a much longer title", 6) == "a much..."
+        assert _ellipsize(None, 10) == "N/A"
+        assert _ellipsize("", 10) == "N/A"
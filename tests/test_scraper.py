@@ -1,11 +1,17 @@
 """Tests for web scraper module."""
 
+import os
+import time
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
 from bs4 import BeautifulSoup
 
-from scraper import ArticleScraper, ScrapedContent, scrape_article
+import scraper as scraper_module
+from scraper import ArticleScraper, HostRateLimiter, ScrapedContent, scrape_article
+
+# Long enough to pass the scraper's minimum viable word count
+LONG_CONTENT = " ".join(["word"] * 60)
 
 
 class TestScrapedContent:
@@ -33,6 +39,17 @@ class TestScrapedContent:
 
         assert content.word_count == 5
 
+    def test_content_word_count_preserved(self):
+        """Test that a stored word count is not recomputed."""
+        content = ScrapedContent(
+            url="https://example.com",
+            title="Test",
+            content="One two three.",
+            word_count=42,
+        )
+
+        assert content.word_count == 42
+
     def test_content_to_dict(self):
         """Test converting content to dictionary."""
         content = ScrapedContent(
@@ -144,6 +161,33 @@ class TestArticleScraper:
             assert content.author == "Goose Author"
             assert content.scraping_method == "goose3"
 
+    def test_extract_with_goose_raw_html(self, test_config):
+        """Test Goose parses supplied HTML without downloading or taking a rate slot."""
+        mock_article = Mock()
+        mock_article.cleaned_text = "Extracted from supplied HTML."
+        mock_article.title = "Title"
+        mock_article.authors = []
+        mock_article.publish_date = None
+        mock_article.meta_description = None
+
+        mock_goose = Mock()
+        mock_goose.extract.return_value = mock_article
+
+        with patch("scraper.get_config", return_value=test_config):
+            scraper = ArticleScraper()
+            scraper.goose = mock_goose
+
+            with patch.object(scraper.rate_limiter, "wait") as mock_wait:
+                content = scraper._extract_with_goose(
+                    "https://example.com", raw_html="<html></html>"
+                )
+
+            assert content.content == "Extracted from supplied HTML."
+            mock_goose.extract.assert_called_once_with(
+                url="https://example.com", raw_html="<html></html>"
+            )
+            mock_wait.assert_not_called()
+
     def test_extract_with_goose_no_content(self, test_config):
         """Test Goose3 extraction with no content."""
         mock_article = Mock()
@@ -190,6 +234,88 @@ class TestArticleScraper:
             assert "main content" in content.content
             assert content.scraping_method == "beautifulsoup"
 
+    @pytest.mark.skipif(
+        scraper_module.HTMLTree is None, reason="resiliparse not installed"
+    )
+    def test_extract_with_resiliparse_success(self, test_config):
+        """Test content extraction with Resiliparse."""
+        mock_response = Mock()
+        mock_response.text = """
+        <html>
+        <head>
+            <title>Test Title</title>
+            <meta name="author" content="Jane Doe">
+            <meta name="description" content="A test article">
+        </head>
+        <body>
+            <nav>Home | About</nav>
+            <article>
+                <h1>Article Title</h1>
+                <p>This is the main content of the article.</p>
+            </article>
+        </body>
+        </html>
+        """
+
+        with patch("scraper.get_config", return_value=test_config):
+            scraper = ArticleScraper()
+            content = scraper._extract_with_resiliparse(
+                "https://example.com", mock_response
+            )
+
+            assert content is not None
+            assert content.title == "Test Title"
+            assert "main content" in content.content
+            assert content.author == "Jane Doe"
+            assert content.meta_description == "A test article"
+            assert content.scraping_method == "resiliparse"
+
+    def test_scrape_failed_fetch_not_repeated(self, test_config):
+        """Test a page that failed to fetch is not downloaded again by later strategies."""
+        with patch("scraper.get_config", return_value=test_config), patch.object(
+            scraper_module, "HTMLTree", Mock()
+        ):
+            scraper = ArticleScraper()
+            with patch.object(
+                scraper, "_fetch_page", return_value=None
+            ) as mock_fetch, patch.object(
+                scraper, "_extract_with_goose", return_value=None
+            ) as mock_goose:
+                assert scraper._scrape_uncached("https://example.com") is None
+
+            assert mock_fetch.call_count == 1
+            mock_goose.assert_not_called()
+
+    def test_scrape_goose_fallback_reuses_fetched_page(self, test_config):
+        """Test Goose extracts from the page fetched for Resiliparse instead of downloading it."""
+        mock_response = Mock()
+        mock_response.text = "<html><body><p>Article</p></body></html>"
+        mock_content = ScrapedContent(
+            url="https://example.com",
+            title="Test",
+            content=LONG_CONTENT,
+            scraping_method="goose3",
+        )
+
+        with patch("scraper.get_config", return_value=test_config), patch.object(
+            scraper_module, "HTMLTree", Mock()
+        ):
+            scraper = ArticleScraper()
+            with patch.object(
+                scraper, "_fetch_page", return_value=mock_response
+            ) as mock_fetch, patch.object(
+                scraper, "_extract_with_resiliparse", return_value=None
+            ), patch.object(
+                scraper, "_extract_with_goose", return_value=mock_content
+            ) as mock_goose:
+                result = scraper._scrape_uncached("https://example.com")
+
+            assert result == mock_content
+            mock_fetch.assert_called_once_with("https://example.com")
+            mock_goose.assert_called_once_with(
+                "https://example.com", raw_html=mock_response.text
+            )
+
     def test_extract_with_beautifulsoup_no_content(self, test_config):
         """Test BeautifulSoup extraction with no content."""
         html_content = "<html><head><title>Empty</title></head><body></body></html>"
@@ -205,13 +331,17 @@ class TestArticleScraper:
 
             assert content is None
 
+    @patch("scraper.HTMLTree", None)
+    @patch("scraper.ArticleScraper._fetch_page")
     @patch("scraper.ArticleScraper._extract_with_goose")
-    def test_scrape_article_goose_success(self, mock_extract_goose, test_config):
+    def test_scrape_article_goose_success(
+        self, mock_extract_goose, mock_fetch, test_config
+    ):
         """Test article scraping with successful Goose3 extraction."""
         mock_content = ScrapedContent(
             url="https://example.com",
             title="Test",
-            content="Content with enough words to pass minimum threshold.",
+            content=LONG_CONTENT,
             scraping_method="goose3",
         )
         mock_extract_goose.return_value = mock_content
@@ -222,7 +352,9 @@ class TestArticleScraper:
 
             assert result == mock_content
             mock_extract_goose.assert_called_once_with("https://example.com")
+            mock_fetch.assert_not_called()
 
+    @patch("scraper.HTMLTree", None)
     @patch("scraper.ArticleScraper._extract_with_beautifulsoup")
     @patch("scraper.ArticleScraper._fetch_page")
     @patch("scraper.ArticleScraper._extract_with_goose")
@@ -237,7 +369,7 @@ class TestArticleScraper:
         mock_content = ScrapedContent(
             url="https://example.com",
             title="Test",
-            content="Content with enough words to pass minimum threshold.",
+            content=LONG_CONTENT,
             scraping_method="beautifulsoup",
         )
         mock_bs.return_value = mock_content
@@ -287,6 +419,113 @@ class TestArticleScraper:
                 assert results[0] == mock_content1
                 assert results[1] == mock_content2
 
+    @patch("scraper.ArticleScraper._scrape_uncached")
+    def test_scrape_article_uses_cache(self, mock_scrape, test_config, tmp_path):
+        """Test that scrape results are cached on disk and reused."""
+        mock_scrape.return_value = ScrapedContent(
+            url="https://example.com",
+            title="Cached Article",
+            content="Cached words " * 40,
+            scraping_method="goose3",
+        )
+
+        with patch("scraper.get_config", return_value=test_config):
+            scraper = ArticleScraper(cache_dir=tmp_path)
+            first = scraper.scrape_article("https://example.com")
+            second = scraper.scrape_article("https://example.com")
+
+            assert mock_scrape.call_count == 1
+            assert second == first
+            assert len(list(tmp_path.glob("*.json.gz"))) == 1
+
+    @patch("scraper.ArticleScraper._scrape_uncached")
+    def test_scrape_article_force_refresh(self, mock_scrape, test_config, tmp_path):
+        """Test that force_refresh bypasses the cache but still updates it."""
+        mock_scrape.return_value = ScrapedContent(
+            url="https://example.com",
+            title="Article",
+            content="Words " * 60,
+        )
+
+        with patch("scraper.get_config", return_value=test_config):
+            scraper = ArticleScraper(cache_dir=tmp_path)
+            scraper.scrape_article("https://example.com")
+            scraper.scrape_article("https://example.com", force_refresh=True)
+            scraper.scrape_article("https://example.com")
+
+            assert mock_scrape.call_count == 2
+            assert len(list(tmp_path.glob("*.json.gz"))) == 1
+
+    @patch("scraper.ArticleScraper._scrape_uncached")
+    def test_scrape_article_cache_expired(self, mock_scrape, test_config, tmp_path):
+        """Test that cache entries older than the TTL are refetched."""
+        mock_scrape.return_value = ScrapedContent(
+            url="https://example.com",
+            title="Article",
+            content="Words " * 60,
+        )
+
+        with patch("scraper.get_config", return_value=test_config):
+            scraper = ArticleScraper(cache_dir=tmp_path)
+            scraper.scrape_article("https://example.com")
+
+            stale = time.time() - scraper.cache_ttl - 60
+            for cache_file in tmp_path.glob("*.json.gz"):
+                os.utime(cache_file, (stale, stale))
+
+            scraper.scrape_article("https://example.com")
+            assert mock_scrape.call_count == 2
+
+    def test_rate_limiter_spaces_same_host(self):
+        """Test that requests to one host are spaced out but other hosts are not."""
+        limiter = HostRateLimiter(requests_per_second=10)
+
+        with patch("scraper.time.monotonic", return_value=100.0), patch(
+            "scraper.time.sleep"
+        ) as mock_sleep:
+            limiter.wait("https://example.com/a")
+            limiter.wait("https://other.com/a")
+            mock_sleep.assert_not_called()
+
+            limiter.wait("https://example.com/b")
+            limiter.wait("https://example.com/c")
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == pytest.approx(
+            [0.1, 0.2]
+        )
+
+    def test_rate_limiter_disabled(self):
+        """Test that a zero rate never blocks."""
+        limiter = HostRateLimiter(requests_per_second=0)
+
+        with patch("scraper.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.wait("https://example.com")
+
+        mock_sleep.assert_not_called()
+
+    def test_goose_is_per_thread(self, test_config):
+        """Test that each thread gets its own Goose instance and cleanup closes all."""
+        import threading
+
+        with patch("scraper.get_config", return_value=test_config), patch(
+            "scraper.Goose", side_effect=lambda: Mock()
+        ):
+            scraper = ArticleScraper()
+            main_goose = scraper.goose
+            assert scraper.goose is main_goose
+
+            other = {}
+            thread = threading.Thread(target=lambda: other.update(goose=scraper.goose))
+            thread.start()
+            thread.join()
+
+            assert other["goose"] is not main_goose
+
+            scraper.cleanup()
+            main_goose.close.assert_called_once()
+            other["goose"].close.assert_called_once()
+
     def test_cleanup(self, test_config):
         """Test scraper cleanup."""
         with patch("scraper.get_config", return_value=test_config):
@@ -204,6 +204,90 @@ class TestTTSConverter:
 
         assert voices == []
 
+    @patch("tts_converter.texttospeech.TextToSpeechClient")
+    def test_convert_segments_to_audio_preserves_order(
+        self, mock_client_class, tmp_path
+    ):
+        """Test that concurrently synthesized segments are joined in order."""
+        import time
+
+        def fake_synthesize(text, *args):
+            # Finish the first segment last to exercise out-of-order completion
+            time.sleep(0.05 if text == "one" else 0)
+            return text.encode()
+
+        converter = TTSConverter()
+        segments = [
+            {"title": "Intro", "text": "one"},
+            {"title": "Story", "text": "two"},
+            {"title": "Outro", "text": "three"},
+        ]
+        output_file = tmp_path / "episode.mp3"
+
+        with patch.object(
+            converter, "_synthesize_chunk", side_effect=fake_synthesize
+        ), patch.object(converter, "_has_ffmpeg", return_value=False):
+            audio_path, chapters = converter.convert_segments_to_audio(
+                segments, str(output_file)
+            )
+
+        assert audio_path == output_file
+        assert output_file.read_bytes() == b"onetwothree"
+        assert [chapter["title"] for chapter in chapters] == [
+            "Intro",
+            "Story",
+            "Outro",
+        ]
+
+    @patch("tts_converter.texttospeech.TextToSpeechClient")
+    def test_convert_segments_to_audio_chunks_long_segments(
+        self, mock_client_class, tmp_path
+    ):
+        """Test that segments over the byte limit are split but keep one chapter."""
+        converter = TTSConverter()
+        converter.MAX_BYTES_PER_CHUNK = 20
+        segments = [
+            {"title": "Intro", "text": "Hi."},
+            {"title": "Story", "text": "First sentence here. Second sentence here."},
+        ]
+        output_file = tmp_path / "episode.mp3"
+
+        with patch.object(
+            converter, "_synthesize_chunk", side_effect=lambda text, *a: text.encode()
+        ) as mock_synthesize, patch.object(
+            converter, "_has_ffmpeg", return_value=False
+        ):
+            audio_path, chapters = converter.convert_segments_to_audio(
+                segments, str(output_file)
+            )
+
+        assert mock_synthesize.call_count == 3
+        assert output_file.read_bytes() == (
+            b"Hi.First sentence here.Second sentence here."
+        )
+        assert [chapter["title"] for chapter in chapters] == ["Intro", "Story"]
+
+    @patch("tts_converter.texttospeech.TextToSpeechClient")
+    def test_synthesized_audio_is_cached(self, mock_client_class, tmp_path):
+        """Test that identical text and voice settings reuse cached audio."""
+        converter = TTSConverter(cache_dir=tmp_path, cache_ttl_hours=24)
+        chunk_args = [
+            ("Hello", "en-US", "en-US-Neural2-D", 1.0, 0.0),
+            ("Hello", "en-US", "en-US-Neural2-A", 1.0, 0.0),
+        ]
+
+        with patch.object(
+            converter, "_synthesize_chunk", side_effect=lambda text, *a: a[1].encode()
+        ) as mock_synthesize:
+            first = converter._synthesize_chunks(chunk_args)
+            second = converter._synthesize_chunks(chunk_args)
+
+        assert first == second == [b"en-US-Neural2-D", b"en-US-Neural2-A"]
+        assert mock_synthesize.call_count == 2
+        assert converter.cache_hits == 2
+        assert converter.cache_misses == 2
+        assert len(list(tmp_path.glob("*.mp3"))) == 2
+
 
 class TestTTSMain:
     """Test TTS converter main function and CLI."""
@@ -1,7 +1,9 @@
 """Mock services for external APIs and dependencies."""
 
 import json
+import threading
 import time
+from contextlib import ExitStack
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from unittest.mock import Mock, MagicMock
@@ -140,6 +142,7 @@ class MockHackerNewsAPI:
             # Return list of story IDs
             story_ids = [story["id"] for story in self.mock_stories]
             response.json.return_value = story_ids
+            response.content = json.dumps(story_ids).encode()
         elif "item" in url:
             # Extract story ID from URL
             story_id = int(url.split("/")[-1].replace(".json", ""))
@@ -148,9 +151,11 @@ class MockHackerNewsAPI:
             )
             if story_data:
                 response.json.return_value = story_data
+                response.content = json.dumps(story_data).encode()
             else:
                 response.status_code = 404
                 response.json.return_value = None
+                response.content = b"null"
 
         return response
 
@@ -271,7 +276,9 @@ class MockArticleScraper:
 
         return articles
 
-    def mock_scrape_article(self, url: str) -> Optional[ScrapedContent]:
+    def mock_scrape_article(
+        self, url: str, force_refresh: bool = False
+    ) -> Optional[ScrapedContent]:
         """Mock article scraping."""
         import random
 
@@ -434,6 +441,12 @@ def create_test_config_file(temp_dir: Path) -> Path:
     return config_file
 
 
+# The context patches class attributes and os.environ, which are process-wide.
+# Contexts opened from several threads would unwind those patches out of order
+# and leave a mock installed, so only one context is active at a time.
+_E2E_CONTEXT_LOCK = threading.RLock()
+
+
 class E2ETestContext:
     """Context manager for E2E test setup and teardown."""
 
@@ -448,40 +461,48 @@ class E2ETestContext:
 
     def __enter__(self):
         """Setup test context."""
-        self.temp_dir = self.temp_env.__enter__()
-        self.config_file = create_test_config_file(self.temp_dir)
-
-        # Setup patches
         from unittest.mock import patch
 
-        self.patches = [
-            patch("requests.Session.get", side_effect=self.mock_hn_api.mock_requests_get),
-            patch(
-                "scraper.ArticleScraper.scrape_article",
-                side_effect=self.mock_scraper.mock_scrape_article,
-            ),
-            patch(
-                "tts_converter.TTSConverter.convert_text_to_speech",
-                side_effect=self.mock_tts.mock_convert_text_to_speech,
-            ),
-        ]
-
-        for p in self.patches:
-            p.__enter__()
-
+        # Everything entered here is unwound by the stack, including when a
+        # later step fails (e.g. a patch target that cannot be imported), so
+        # no patch outlives the context
+        stack = ExitStack()
+        _E2E_CONTEXT_LOCK.acquire()
+        stack.callback(_E2E_CONTEXT_LOCK.release)
+        try:
+            self.temp_dir = stack.enter_context(self.temp_env)
+            self.config_file = create_test_config_file(self.temp_dir)
+
+            # Cleanup mock files once the patches are stopped
+            stack.callback(self.mock_tts.cleanup_generated_files)
+
+            # Setup patches
+            self.patches = [
+                patch("requests.Session.get", side_effect=self.mock_hn_api.mock_requests_get),
+                patch(
+                    "scraper.ArticleScraper.scrape_article",
+                    side_effect=self.mock_scraper.mock_scrape_article,
+                ),
+                patch(
+                    "tts_converter.TTSConverter.convert_text_to_speech",
+                    side_effect=self.mock_tts.mock_convert_text_to_speech,
+                ),
+            ]
+
+            for p in self.patches:
+                stack.enter_context(p)
+        except BaseException:
+            stack.close()
+            raise
+
+        self._exit_stack = stack
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Cleanup test context."""
-        # Stop patches
-        for p in reversed(self.patches):
-            p.__exit__(exc_type, exc_val, exc_tb)
-
-        # Cleanup mock files
-        self.mock_tts.cleanup_generated_files()
-
-        # Cleanup temp environment
-        self.temp_env.__exit__(exc_type, exc_val, exc_tb)
+        # Stop patches, remove mock files, restore the temp environment, then
+        # let the next context in
+        return self._exit_stack.__exit__(exc_type, exc_val, exc_tb)
 
     @property
     def output_dir(self) -> Path:
@@ -1,12 +1,19 @@
 #!/usr/bin/env python
 
+import hashlib
+import json
 import os
 import sys
 import logging
 import tempfile
 import re
+import shutil
 import subprocess
-from typing import Optional, List, Tuple, Dict, NamedTuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Optional, List, Tuple, Dict, NamedTuple
 from datetime import datetime
 from pathlib import Path
 from google.cloud import texttospeech
@@ -39,7 +46,17 @@ class TTSConverter:
     # Maximum bytes per request (leave some buffer below the 5000 limit)
     MAX_BYTES_PER_CHUNK = 4500
 
-    def __init__(self, credentials_path: Optional[str] = None, enable_podcast_transformation: bool = True):
+    # Maximum synthesis requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 8
+
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        enable_podcast_transformation: bool = True,
+        max_concurrent_requests: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+        cache_ttl_hours: int = 0,
+    ):
         """
         Initialize the TTS converter.
 
@@ -47,7 +64,19 @@ class TTSConverter:
             credentials_path: Path to Google Cloud service account key file.
                             If None, uses GOOGLE_APPLICATION_CREDENTIALS env var.
             enable_podcast_transformation: Whether to transform text to podcast format before TTS
+            max_concurrent_requests: Synthesis requests in flight at once
+                            (defaults to MAX_CONCURRENT_REQUESTS)
+            cache_dir: Directory for cached synthesized audio (caching disabled if None)
+            cache_ttl_hours: Hours a cached clip is reused before resynthesizing
         """
+        self.max_concurrent_requests = max_concurrent_requests or self.MAX_CONCURRENT_REQUESTS
+
+        # Synthesized audio is reused across runs for identical text and voice
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl_hours * 3600
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         if credentials_path:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
 
@@ -152,21 +181,24 @@ class TTSConverter:
         total_duration = 0.0
 
         try:
-            for i, segment in enumerate(segments):
+            # Articles usually exceed the per-request byte limit, so split each
+            # segment and synthesize every chunk of every segment as one batch
+            segment_chunks = [self._chunk_text(segment["text"]) for segment in segments]
+            chunk_args = [
+                (chunk, language_code, voice_name, speaking_rate, pitch)
+                for chunks in segment_chunks
+                for chunk in chunks
+            ]
+            logger.info(f"Synthesizing {len(segments)} segments in {len(chunk_args)} requests")
+            audio_contents = iter(self._synthesize_chunks(chunk_args))
+
+            for i, (segment, chunks) in enumerate(zip(segments, segment_chunks)):
                 logger.info(f"Processing segment {i+1}/{len(segments)}: {segment['title']}")
 
-                # Synthesize audio for the segment
-                audio_content = self._synthesize_chunk(
-                    segment["text"],
-                    language_code,
-                    voice_name,
-                    speaking_rate,
-                    pitch
-                )
-
-                # Save to a temporary file
+                # Save to a temporary file, joining the segment's MP3 chunks
                 with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-                    temp_file.write(audio_content)
+                    for audio_content in islice(audio_contents, len(chunks)):
+                        temp_file.write(audio_content)
                     temp_files.append(temp_file.name)
 
                 # Get duration and create chapter
@@ -373,6 +405,94 @@ class TTSConverter:
 
         return response.audio_content
 
+    def _synthesize_chunks(self, chunk_args: List[Tuple]) -> List[bytes]:
+        """
+        Synthesize several text chunks concurrently.
+
+        Chunks already in the audio cache are read from disk. The rest are
+        independent network round-trips, so they are issued through a bounded
+        thread pool sharing the same client.
+
+        Args:
+            chunk_args: Positional arguments for _synthesize_chunk, one tuple per chunk
+
+        Returns:
+            Audio content for each chunk, in input order
+
+        Raises:
+            Exception: If any synthesis fails
+        """
+        audio_contents = [self._load_cached_audio(args) for args in chunk_args]
+        misses = [i for i, audio in enumerate(audio_contents) if audio is None]
+        if self.cache_dir and self.cache_ttl:
+            self.cache_hits += len(chunk_args) - len(misses)
+            self.cache_misses += len(misses)
+
+        if len(misses) <= 1:
+            synthesized = [self._synthesize_chunk(*chunk_args[i]) for i in misses]
+        else:
+            max_workers = min(self.max_concurrent_requests, len(misses))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                synthesized = list(
+                    executor.map(lambda i: self._synthesize_chunk(*chunk_args[i]), misses)
+                )
+
+        for i, audio_content in zip(misses, synthesized):
+            audio_contents[i] = audio_content
+            self._store_cached_audio(chunk_args[i], audio_content)
+
+        return audio_contents
+
+    def _cache_path(self, chunk_args: Tuple) -> Path:
+        """Get the cache file path for a chunk's text and voice settings."""
+        key = hashlib.sha256(json.dumps(chunk_args).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.mp3"
+
+    def _load_cached_audio(self, chunk_args: Tuple) -> Optional[bytes]:
+        """
+        Load cached audio for a chunk if it is still within the TTL.
+
+        Args:
+            chunk_args: Positional arguments for _synthesize_chunk
+
+        Returns:
+            Cached audio content or None on a miss
+        """
+        if not self.cache_dir or not self.cache_ttl:
+            return None
+
+        cache_path = self._cache_path(chunk_args)
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+            return cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable TTS cache entry {cache_path}: {e}")
+            return None
+
+    def _store_cached_audio(self, chunk_args: Tuple, audio_content: bytes) -> None:
+        """
+        Write synthesized audio for a chunk to the cache.
+
+        Args:
+            chunk_args: Positional arguments for _synthesize_chunk
+            audio_content: Synthesized audio
+        """
+        if not self.cache_dir or not self.cache_ttl:
+            return
+
+        cache_path = self._cache_path(chunk_args)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(audio_content)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache synthesized audio: {e}")
+
     def _convert_dialogue_to_speech(
         self,
         text: str,
@@ -400,18 +520,20 @@ class TTSConverter:
             # Process each segment and collect audio files
             temp_files = []
 
-            for i, segment in enumerate(segments):
-                logger.info(f"Processing segment {i+1}/{len(segments)} - {segment.speaker}: {segment.text[:50]}...")
-
-                # Synthesize this segment with the appropriate voice
-                voice_config = segment.voice_config
-                audio_content = self._synthesize_chunk(
+            # Synthesize every segment with its speaker's voice
+            audio_contents = self._synthesize_chunks([
+                (
                     segment.text,
-                    voice_config["language_code"],
-                    voice_config["voice_name"],
-                    voice_config["speaking_rate"],
-                    voice_config["pitch"],
+                    segment.voice_config["language_code"],
+                    segment.voice_config["voice_name"],
+                    segment.voice_config["speaking_rate"],
+                    segment.voice_config["pitch"],
                 )
+                for segment in segments
+            ])
+
+            for i, (segment, audio_content) in enumerate(zip(segments, audio_contents)):
+                logger.info(f"Processing segment {i+1}/{len(segments)} - {segment.speaker}: {segment.text[:50]}...")
 
                 # Save to temporary file
                 with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
@@ -459,8 +581,6 @@ class TTSConverter:
         Returns:
             Path to the saved script file
         """
-        import shutil
-
         # Get date string for directory
         date_str = datetime.now().strftime("%Y%m%d")
 
@@ -637,13 +757,13 @@ class TTSConverter:
             # Process each chunk and collect audio files
             temp_files = []
 
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Processing chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
+            audio_contents = self._synthesize_chunks([
+                (chunk, language_code, voice_name, speaking_rate, pitch)
+                for chunk in chunks
+            ])
 
-                # Synthesize this chunk
-                audio_content = self._synthesize_chunk(
-                    chunk, language_code, voice_name, speaking_rate, pitch
-                )
+            for i, (chunk, audio_content) in enumerate(zip(chunks, audio_contents)):
+                logger.info(f"Processing chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
 
                 # Save to temporary file
                 with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
@@ -712,10 +832,12 @@ class TTSConverter:
 
     def _concatenate_binary(self, temp_files: List[str], output_file: str) -> None:
         """Simple binary concatenation of MP3 files."""
+        # MP3 frames are self-contained, so segments can be streamed back to
+        # back without decoding or holding whole files in memory
         with open(output_file, 'wb') as outfile:
             for temp_file in temp_files:
                 with open(temp_file, 'rb') as infile:
-                    outfile.write(infile.read())
+                    shutil.copyfileobj(infile, outfile, 1 << 20)
 
     def get_available_voices(self, language_code: str = "en-US") -> list:
         """